@@ -0,0 +1,120 @@
+"""Persistent cache for YouTube's static browser assets."""
+import json
+import logging
+import sqlite3
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Hosts and path prefixes that only serve versioned, immutable assets
+CACHEABLE_HOSTS = ('ytimg.com', 'gstatic.com')
+CACHEABLE_YOUTUBE_PREFIX = '/s/'
+CACHEABLE_RESOURCE_TYPES = frozenset({"script", "stylesheet"})
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class AssetCache:
+    """SQLite-backed store of static asset responses, keyed by URL."""
+    
+    def __init__(self, path: str):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: SQLite file to keep cached responses in
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        # Playwright calls route handlers from its dispatcher, so allow use outside the opening thread
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS assets (url TEXT PRIMARY KEY, headers TEXT NOT NULL, body BLOB NOT NULL)"
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def is_cacheable(url: str, resource_type: str) -> bool:
+        """Check if a request is for a versioned static asset worth caching."""
+        if resource_type not in CACHEABLE_RESOURCE_TYPES:
+            return False
+        
+        parsed = urlparse(url)
+        host = parsed.hostname or ""
+        if host.endswith(CACHEABLE_HOSTS):
+            return True
+        return host.endswith('youtube.com') and parsed.path.startswith(CACHEABLE_YOUTUBE_PREFIX)
+    
+    def get(self, url: str) -> Optional[Tuple[Dict[str, str], bytes]]:
+        """
+        Look up a cached response.
+        
+        Args:
+            url: Request URL
+        
+        Returns:
+            Tuple of (headers, body), or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT headers, body FROM assets WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+    
+    def put(self, url: str, headers: Dict[str, str], body: bytes):
+        """
+        Store a response.
+        
+        Args:
+            url: Request URL
+            headers: Response headers
+            body: Response body
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO assets (url, headers, body) VALUES (?, ?, ?)",
+                (url, json.dumps(headers), body)
+            )
+            self._conn.commit()
+    
+    def handle_route(self, route) -> bool:
+        """
+        Serve a Playwright route from the cache, fetching and storing it on a miss.
+        
+        Args:
+            route: Playwright Route for a cacheable request
+        
+        Returns:
+            True if the route was fulfilled
+        """
+        url = route.request.url
+        cached = self.get(url)
+        if cached is not None:
+            headers, body = cached
+            route.fulfill(status=200, headers=headers, body=body)
+            return True
+        
+        try:
+            response = route.fetch()
+        except Exception as e:
+            logger.debug(f"Asset fetch failed for {url}: {e}")
+            return False
+        
+        body = response.body()
+        if response.status == 200 and 'no-store' not in response.headers.get('cache-control', ''):
+            # The body is stored decoded, so drop headers describing the wire encoding
+            headers = {k: v for k, v in response.headers.items() if k.lower() not in _WIRE_HEADERS}
+            try:
+                self.put(url, headers, body)
+            except sqlite3.Error as e:
+                logger.warning(f"⚠ Could not cache asset {url}: {e}")
+        
+        route.fulfill(response=response, body=body)
+        return True
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,9 +1,65 @@
 """2Captcha API integration for solving reCAPTCHA challenges."""
+import logging
 import time
+import random
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 import config
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to requests' JSON decoding
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Seconds a fetched account balance is reused before asking 2Captcha again
+BALANCE_CACHE_TTL = 10
+
+# Extra seconds a worker waits on a pooled solve beyond the solver timeout,
+# covering the last poll interval and its HTTP request
+POOL_RESULT_MARGIN = 60
+
+# Transport-level retries for transient 2Captcha failures, jittered so
+# concurrent solvers don't retry in lockstep. Only GETs are retried after the
+# request went out: a timed-out in.php POST may still have been accepted and
+# billed. Connection errors are retried for every method since nothing was sent.
+RETRY_POLICY = Retry(
+    total=5,
+    backoff_factor=0.3,
+    backoff_jitter=0.5,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(["GET"])
+)
+
+
+@lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """
+    Get the process-wide pooled HTTP session shared by all solvers.
+    
+    Sharing one session keeps TLS connections alive across CaptchaSolver
+    instances. The solver only issues independent GET/POST calls, which
+    requests handles safely from multiple threads.
+    
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=50,
+        pool_maxsize=50,
+        max_retries=RETRY_POLICY
+    )
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
 
 class CaptchaSolver:
     """Handles reCAPTCHA solving using 2Captcha API."""
@@ -21,16 +77,44 @@ class CaptchaSolver:
         
         self.base_url = "https://2captcha.com"
         self.timeout = config.CAPTCHA_TIMEOUT
+        self.session = _get_session()
+        self._balance_cache = None  # (timestamp, balance)
+        self._solve_ema = 25.0  # Moving average of solve time in seconds
+        # Set to a CaptchaPool when several workers share this solver, so their
+        # outstanding captchas are polled together instead of one loop each
+        self.pool = None
+    
+    def _parse_response(self, response: requests.Response) -> Dict[str, Any]:
+        """
+        Decode a 2Captcha JSON response.
+        
+        2Captcha reports failures in the body with HTTP 200, so the status code
+        is not checked separately; a non-JSON error page raises here instead.
+        
+        Returns:
+            Parsed response body
+        """
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
     
-    def get_balance(self) -> float:
+    def get_balance(self, force: bool = False) -> float:
         """
         Get current account balance.
         
+        Args:
+            force: If True, bypass the short-lived cache and query 2Captcha.
+        
         Returns:
             Balance in USD
         """
+        if not force and self._balance_cache:
+            cached_at, balance = self._balance_cache
+            if time.time() - cached_at < BALANCE_CACHE_TTL:
+                return balance
+        
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/res.php",
                 params={
                     "key": self.api_key,
@@ -39,16 +123,17 @@ class CaptchaSolver:
                 },
                 timeout=10
             )
-            response.raise_for_status()
-            data = response.json()
+            data = self._parse_response(response)
             
             if data.get("status") == 1:
-                return float(data.get("request", 0))
+                balance = float(data.get("request", 0))
+                self._balance_cache = (time.time(), balance)
+                return balance
             else:
-                print(f"Warning: Could not get balance: {data.get('request')}")
+                logger.warning(f"Warning: Could not get balance: {data.get('request')}")
                 return 0.0
         except Exception as e:
-            print(f"Error getting balance: {e}")
+            logger.error(f"Error getting balance: {e}")
             return 0.0
     
     def solve_recaptcha(self, site_key: str, page_url: str) -> Optional[str]:
@@ -62,26 +147,49 @@ class CaptchaSolver:
         Returns:
             The captcha solution token, or None if solving failed
         """
-        print(f"Submitting reCAPTCHA to 2Captcha (sitekey: {site_key[:20]}...)")
+        logger.info(f"Submitting reCAPTCHA to 2Captcha (sitekey: {site_key[:20]}...)")
+        
+        if self.pool is not None:
+            solution = self.pool.wait(self.pool.submit(site_key, page_url))
+            if not solution:
+                logger.warning("✗ Failed to solve captcha")
+            return solution
         
         # Step 1: Submit the captcha
         captcha_id = self._submit_captcha(site_key, page_url)
         if not captcha_id:
             return None
         
-        print(f"Captcha submitted, ID: {captcha_id}")
-        print("Waiting for solution (this may take 15-60 seconds)...")
+        logger.info(f"Captcha submitted, ID: {captcha_id}")
+        logger.info("Waiting for solution (this may take 15-60 seconds)...")
         
         # Step 2: Poll for the solution
         solution = self._get_solution(captcha_id)
         
         if solution:
-            print("✓ Captcha solved successfully!")
+            logger.info("✓ Captcha solved successfully!")
         else:
-            print("✗ Failed to solve captcha")
+            logger.warning("✗ Failed to solve captcha")
         
         return solution
     
+    def solve_many(self, pairs: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """
+        Solve several reCAPTCHA challenges concurrently.
+        
+        All captchas are submitted up front and then polled together with a
+        single multi-id request per tick (see CaptchaPool).
+        
+        Args:
+            pairs: List of (site_key, page_url) tuples
+            
+        Returns:
+            List of solution tokens (or None) in the same order as pairs
+        """
+        pool = self.pool or CaptchaPool(self)
+        futures = [pool.submit(site_key, page_url) for site_key, page_url in pairs]
+        return [pool.wait(future) for future in futures]
+    
     def _submit_captcha(self, site_key: str, page_url: str) -> Optional[str]:
         """
         Submit a captcha to 2Captcha for solving.
@@ -90,7 +198,7 @@ class CaptchaSolver:
             The captcha ID if successful, None otherwise
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/in.php",
                 data={
                     "key": self.api_key,
@@ -101,18 +209,17 @@ class CaptchaSolver:
                 },
                 timeout=30
             )
-            response.raise_for_status()
-            data = response.json()
+            data = self._parse_response(response)
             
             if data.get("status") == 1:
                 return data.get("request")
             else:
                 error = data.get("request", "Unknown error")
-                print(f"Error submitting captcha: {error}")
+                logger.error(f"Error submitting captcha: {error}")
                 return None
                 
         except Exception as e:
-            print(f"Exception submitting captcha: {e}")
+            logger.error(f"Exception submitting captcha: {e}")
             return None
     
     def _get_solution(self, captcha_id: str) -> Optional[str]:
@@ -126,13 +233,17 @@ class CaptchaSolver:
             The solution token if successful, None otherwise
         """
         start_time = time.time()
-        wait_time = 5  # Start checking after 5 seconds
+        # First check lands near the typical solve time to skip polls that can't succeed
+        wait_time = max(5.0, 0.8 * self._solve_ema)
+        error_attempts = 0
+        # Jitter keeps concurrent solvers from polling in lockstep
+        delay = wait_time * random.uniform(0.8, 1.2)
         
         while time.time() - start_time < self.timeout:
-            time.sleep(wait_time)
+            time.sleep(delay)
             
             try:
-                response = requests.get(
+                response = self.session.get(
                     f"{self.base_url}/res.php",
                     params={
                         "key": self.api_key,
@@ -142,30 +253,76 @@ class CaptchaSolver:
                     },
                     timeout=30
                 )
-                response.raise_for_status()
-                data = response.json()
+                data = self._parse_response(response)
                 
                 if data.get("status") == 1:
                     # Solution ready
+                    elapsed = time.time() - start_time
+                    self._solve_ema = 0.2 * elapsed + 0.8 * self._solve_ema
                     return data.get("request")
                 elif data.get("request") == "CAPCHA_NOT_READY":
                     # Still processing
                     elapsed = int(time.time() - start_time)
-                    print(f"  Still solving... ({elapsed}s elapsed)")
-                    wait_time = 5  # Check every 5 seconds
+                    logger.info(f"  Still solving... ({elapsed}s elapsed)")
+                    wait_time = min(wait_time * 1.5, 15.0)  # Back off up to 15 seconds
                 else:
                     # Error
                     error = data.get("request", "Unknown error")
-                    print(f"Error getting solution: {error}")
+                    logger.error(f"Error getting solution: {error}")
                     return None
                     
             except Exception as e:
-                print(f"Exception getting solution: {e}")
-                time.sleep(5)
+                logger.warning(f"Exception getting solution: {e}")
+                # Full-jitter backoff on transport errors replaces the next poll wait,
+                # then fast polling resumes
+                error_attempts += 1
+                delay = random.uniform(0, min(30, 2 ** error_attempts))
+                wait_time = 5.0
+                continue
+            
+            delay = wait_time * random.uniform(0.8, 1.2)
         
-        print(f"Timeout after {self.timeout} seconds")
+        logger.warning(f"Timeout after {self.timeout} seconds")
         return None
     
+    def _get_statuses(self, captcha_ids: List[str]) -> Optional[List[str]]:
+        """
+        Fetch the status of several submitted captchas in one request.
+        
+        Args:
+            captcha_ids: IDs returned when submitting the captchas
+            
+        Returns:
+            One entry per ID (a solution token, CAPCHA_NOT_READY or an ERROR_ code),
+            or None if the request failed
+        """
+        try:
+            response = self.session.get(
+                f"{self.base_url}/res.php",
+                params={
+                    "key": self.api_key,
+                    "action": "get",
+                    "ids": ",".join(captcha_ids),
+                    "json": 1
+                },
+                timeout=30
+            )
+            data = self._parse_response(response)
+            statuses = str(data.get("request", "")).split("|")
+        except Exception as e:
+            logger.warning(f"Exception getting solutions: {e}")
+            return None
+        
+        if len(statuses) == 1 and statuses[0].startswith("ERROR"):
+            # Account-level errors are reported once for the whole batch
+            statuses = statuses * len(captcha_ids)
+        
+        if len(statuses) != len(captcha_ids):
+            logger.error(f"Unexpected batch status response: {data.get('request')}")
+            return None
+        
+        return statuses
+    
     def report_bad(self, captcha_id: str) -> bool:
         """
         Report a captcha as incorrectly solved (get refund).
@@ -177,7 +334,7 @@ class CaptchaSolver:
             True if reported successfully
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/res.php",
                 params={
                     "key": self.api_key,
@@ -187,35 +344,148 @@ class CaptchaSolver:
                 },
                 timeout=10
             )
-            response.raise_for_status()
-            data = response.json()
+            data = self._parse_response(response)
             return data.get("status") == 1
         except Exception as e:
-            print(f"Error reporting bad captcha: {e}")
+            logger.error(f"Error reporting bad captcha: {e}")
             return False
 
 
+class CaptchaPool:
+    """Tracks outstanding captchas and polls them all with one request per tick."""
+    
+    def __init__(self, solver: CaptchaSolver, poll_interval: float = 5.0):
+        """
+        Initialize the pool.
+        
+        Args:
+            solver: CaptchaSolver used to submit and poll captchas
+            poll_interval: Seconds between batch polls
+        """
+        self.solver = solver
+        self.poll_interval = poll_interval
+        self._pending = {}  # captcha_id -> (future, submitted_at)
+        self._lock = threading.Lock()
+        self._thread = None
+    
+    def submit(self, site_key: str, page_url: str) -> Future:
+        """
+        Submit a reCAPTCHA and return a future for its solution.
+        
+        Args:
+            site_key: The reCAPTCHA site key (data-sitekey)
+            page_url: The URL of the page with the captcha
+            
+        Returns:
+            Future resolving to the solution token, or None if solving failed
+        """
+        future = Future()
+        
+        captcha_id = self.solver._submit_captcha(site_key, page_url)
+        if not captcha_id:
+            future.set_result(None)
+            return future
+        
+        logger.info(f"Captcha submitted, ID: {captcha_id}")
+        
+        with self._lock:
+            self._pending[captcha_id] = (future, time.time())
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._poll_loop, daemon=True)
+                self._thread.start()
+        
+        return future
+    
+    def wait(self, future: Future) -> Optional[str]:
+        """
+        Block until a submitted captcha is solved or the solver timeout has passed.
+        
+        Args:
+            future: Future returned by submit()
+            
+        Returns:
+            The solution token, or None if solving failed or timed out
+        """
+        try:
+            return future.result(timeout=self.solver.timeout + POOL_RESULT_MARGIN)
+        except FutureTimeout:
+            logger.warning(f"Timeout after {self.solver.timeout} seconds waiting for pooled captcha")
+            return None
+    
+    def _poll_loop(self):
+        """Poll every outstanding captcha until none are left."""
+        try:
+            while True:
+                time.sleep(self.poll_interval * random.uniform(0.8, 1.2))
+                
+                with self._lock:
+                    if not self._pending:
+                        self._thread = None
+                        return
+                    captcha_ids = list(self._pending)
+                
+                statuses = self.solver._get_statuses(captcha_ids) or [None] * len(captcha_ids)
+                now = time.time()
+                
+                with self._lock:
+                    for captcha_id, status in zip(captcha_ids, statuses):
+                        future, submitted_at = self._pending[captcha_id]
+                        
+                        if status is None or status == "CAPCHA_NOT_READY":
+                            if now - submitted_at >= self.solver.timeout:
+                                logger.warning(f"Timeout after {self.solver.timeout} seconds (ID: {captcha_id})")
+                                del self._pending[captcha_id]
+                                self._resolve(future, None)
+                            continue
+                        
+                        del self._pending[captcha_id]
+                        if status.startswith("ERROR"):
+                            logger.error(f"Error getting solution for {captcha_id}: {status}")
+                            self._resolve(future, None)
+                        else:
+                            logger.info(f"✓ Captcha {captcha_id} solved")
+                            self._resolve(future, status)
+        except Exception as e:
+            logger.error(f"✗ Captcha poller stopped: {e}")
+        finally:
+            # If the loop died, fail whatever is still outstanding so no worker waits on
+            # a dead poller, and let the next submit() start a fresh one
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    for future, _ in self._pending.values():
+                        self._resolve(future, None)
+                    self._pending.clear()
+                    self._thread = None
+    
+    @staticmethod
+    def _resolve(future: Future, result: Optional[str]):
+        """Set a future's result unless it has already been resolved."""
+        if not future.done():
+            future.set_result(result)
+
+
 def test_api_key():
     """Test the 2Captcha API key and show balance."""
-    print("Testing 2Captcha API connection...")
+    logger.info("Testing 2Captcha API connection...")
     
     try:
         solver = CaptchaSolver()
-        print(f"✓ API key is valid")
+        logger.info(f"✓ API key is valid")
         
         balance = solver.get_balance()
-        print(f"✓ Account balance: ${balance:.2f}")
+        logger.info(f"✓ Account balance: ${balance:.2f}")
         
         if balance < 0.01:
-            print("⚠ Warning: Low balance. Add funds at https://2captcha.com")
+            logger.warning("⚠ Warning: Low balance. Add funds at https://2captcha.com")
         
         return True
     except Exception as e:
-        print(f"✗ Error: {e}")
+        logger.error(f"✗ Error: {e}")
         return False
 
 
 if __name__ == "__main__":
     # Test the API when run directly
+    config.setup_logging(verbose=True)
     test_api_key()
 
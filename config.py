@@ -1,7 +1,14 @@
 """Configuration settings for YouTube scraper."""
+import atexit
+import logging
+import logging.handlers
 import os
+import queue
+import sys
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
@@ -14,12 +21,59 @@ SESSION_FILE = "youtube_session.json"
 
 # Scraper settings
 DELAY_BETWEEN_PROFILES = int(os.getenv("DELAY_BETWEEN_PROFILES", "3"))
+# Channel page loads allowed per minute per host (defaults to one per DELAY_BETWEEN_PROFILES)
+RATE_LIMIT_PER_MINUTE = float(os.getenv(
+    "RATE_LIMIT_PER_MINUTE",
+    str(60 / DELAY_BETWEEN_PROFILES if DELAY_BETWEEN_PROFILES > 0 else 0)
+))
 HEADLESS = os.getenv("HEADLESS", "False").lower() == "true"
+MAX_WORKERS = int(os.getenv("MAX_WORKERS", "1"))  # Parallel browsers in batch mode
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "50"))  # Results buffered before writing to disk
+DEBUG = os.getenv("SCRAPER_DEBUG", "0") == "1"  # Print full tracebacks for scrape errors (also set by --debug)
 
 # Browser settings
+# CDP endpoint of a running Chromium to share between workers instead of launching one each
+CDP_URL = os.getenv("CDP_URL", "")
+# SQLite file caching YouTube's static JS/CSS between runs (set empty to disable)
+ASSET_CACHE_FILE = os.getenv("ASSET_CACHE_FILE", "asset_cache.sqlite")
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
+# Logging settings
+LOG_FORMAT = "%(message)s"
+
+_log_listener = None
+
+
+def setup_logging(verbose: bool = False):
+    """
+    Configure logging for the scraper.
+    
+    Records are handed to a background thread through a queue, so progress
+    messages never block on writes to stderr.
+    
+    Args:
+        verbose: If True, show progress (INFO) messages. Otherwise only warnings and errors.
+    """
+    global _log_listener
+    
+    root = logging.getLogger()
+    root.setLevel(logging.INFO if verbose else logging.WARNING)
+    
+    if _log_listener is not None:
+        return
+    
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
 # Validation
 if not CAPTCHA_API_KEY:
-    print("WARNING: CAPTCHA_API_KEY not set in .env file")
+    logger.warning("WARNING: CAPTCHA_API_KEY not set in .env file")
 
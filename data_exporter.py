@@ -1,9 +1,47 @@
 """Data export functionality for YouTube scraper results."""
 import json
 import csv
+import logging
+import mmap
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _dump_json(data: Any, indent: bool = True) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# CSV columns: every field the scraper emits, always written in this order so the
+# header doesn't depend on which fields the first batch happened to have
+PRIORITY_FIELDS = (
+    'channel_url', 'channel_handle', 'channel_name', 'email',
+    'subscribers', 'video_count', 'total_views', 'joined_date',
+    'country', 'description', 'social_links', 'scraped_at'
+)
+PRIORITY_FIELD_SET = frozenset(PRIORITY_FIELDS)
+
+# Large write buffers so a whole export batch reaches disk in a few syscalls
+WRITE_BUFFER_SIZE = 1 << 20
 
 
 class DataExporter:
@@ -17,7 +55,11 @@ class DataExporter:
             output_dir: Directory to save output files
         """
         self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
+        self.outdir = Path(output_dir)
+        self.outdir.mkdir(parents=True, exist_ok=True)
+        
+        # Column order per CSV file, computed once when the header is written
+        self._csv_fieldnames = {}
     
     def export_to_json(self, data: List[Dict[str, Any]], filename: str = None, append: bool = True) -> str:
         """
@@ -35,14 +77,23 @@ class DataExporter:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"youtube_channels_{timestamp}.json"
         
-        filepath = os.path.join(self.output_dir, filename)
+        filepath = self.outdir / filename
+        
+        # Fast path: splice new records into the existing array without re-reading it
+        if append and data:
+            try:
+                if self._append_to_json_array(filepath, data):
+                    logger.info(f"✓ Exported {len(data)} channel(s) to JSON: {filepath}")
+                    return str(filepath)
+            except FileNotFoundError:
+                pass
         
         # Handle append mode
         existing_data = []
-        if append and os.path.exists(filepath):
+        if append:
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
+                with filepath.open('rb') as f:
+                    existing_data = _load_json(f.read())
                     if not isinstance(existing_data, list):
                         existing_data = [existing_data]
             except:
@@ -52,13 +103,78 @@ class DataExporter:
         all_data = existing_data + data
         
         # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(all_data, f, indent=2, ensure_ascii=False)
+        with filepath.open('wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(_dump_json(all_data))
         
-        print(f"✓ Exported {len(data)} channel(s) to JSON: {filepath}")
-        print(f"  Total channels in file: {len(all_data)}")
+        logger.info(f"✓ Exported {len(data)} channel(s) to JSON: {filepath}")
+        logger.info(f"  Total channels in file: {len(all_data)}")
         
-        return filepath
+        return str(filepath)
+    
+    def _append_to_json_array(self, filepath: Path, new_items: List[Dict[str, Any]]) -> bool:
+        """
+        Append items to a JSON array file in place by rewriting only its closing bracket.
+        
+        Args:
+            filepath: Path to an existing JSON file
+            new_items: Non-empty list of items to append
+            
+        Returns:
+            True if appended, False if the file is not a JSON array (caller should rewrite it)
+            
+        Raises:
+            FileNotFoundError: If the file does not exist yet
+        """
+        with filepath.open('rb+') as f:
+            if f.read(64).lstrip()[:1] != b'[':
+                return False
+            
+            end = f.seek(0, os.SEEK_END)
+            tail_start = max(0, end - 4096)
+            f.seek(tail_start)
+            tail = f.read().rstrip()
+            if not tail.endswith(b']'):
+                return False
+            
+            before_bracket = tail[:-1].rstrip()
+            if not before_bracket:
+                return False
+            
+            # Serialize as a formatted array and keep only the items between the brackets
+            body = _dump_json(new_items)[1:-1]
+            separator = b'' if before_bracket.endswith(b'[') else b','
+            
+            f.seek(tail_start + len(before_bracket))
+            f.truncate()
+            f.write(separator + body + b']')
+        
+        return True
+    
+    def export_to_jsonl(self, data: List[Dict[str, Any]], filename: str = None, append: bool = True) -> str:
+        """
+        Export data to a JSON Lines file (one JSON object per line).
+        
+        Args:
+            data: List of channel data dictionaries
+            filename: Output filename. If None, generates one with timestamp.
+            append: If True, add lines to an existing file. If False, overwrite.
+            
+        Returns:
+            Path to the output file
+        """
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"youtube_channels_{timestamp}.jsonl"
+        
+        filepath = self.outdir / filename
+        
+        with filepath.open('ab' if append else 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            for item in data:
+                f.write(_dump_json(item, indent=False) + b'\n')
+        
+        logger.info(f"✓ Exported {len(data)} channel(s) to JSON Lines: {filepath}")
+        
+        return str(filepath)
     
     def export_to_csv(self, data: List[Dict[str, Any]], filename: str = None, append: bool = True) -> str:
         """
@@ -68,68 +184,90 @@ class DataExporter:
             data: List of channel data dictionaries
             filename: Output filename. If None, generates one with timestamp.
             append: If True and file exists, append rows. If False, overwrite.
+                Appended rows keep the file's existing header; keys missing from it
+                are logged and left out of the CSV.
             
         Returns:
             Path to the output file
         """
         if not data:
-            print("⚠ No data to export to CSV")
+            logger.warning("⚠ No data to export to CSV")
             return None
         
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"youtube_channels_{timestamp}.csv"
         
-        filepath = os.path.join(self.output_dir, filename)
+        filepath = self.outdir / filename
         
-        # Flatten social_links if present
+        # Flatten social_links and collect field names in a single pass
         flattened_data = []
+        all_fields = set()
         for item in data:
-            flat_item = item.copy()
-            
-            # Convert social_links dict to string
-            if 'social_links' in flat_item and isinstance(flat_item['social_links'], dict):
-                social_links = flat_item['social_links']
-                flat_item['social_links'] = '; '.join([f"{k}: {v}" for k, v in social_links.items()])
+            social_links = item.get('social_links')
+            if isinstance(social_links, dict):
+                # Only copy records that actually need flattening
+                item = dict(item, social_links='; '.join([f"{k}: {v}" for k, v in social_links.items()]))
             
-            flattened_data.append(flat_item)
-        
-        # Determine all possible fields
-        all_fields = set()
-        for item in flattened_data:
             all_fields.update(item.keys())
+            flattened_data.append(item)
         
-        # Define field order (common fields first)
-        priority_fields = [
-            'channel_url', 'channel_handle', 'channel_name', 'email',
-            'subscribers', 'video_count', 'total_views', 'joined_date',
-            'country', 'description', 'social_links', 'scraped_at'
-        ]
-        
-        # Create ordered field list
-        fieldnames = [f for f in priority_fields if f in all_fields]
-        remaining_fields = sorted(all_fields - set(fieldnames))
-        fieldnames.extend(remaining_fields)
+        # Open the file, writing headers only when it is newly created
+        if append:
+            try:
+                f = filepath.open('x', buffering=WRITE_BUFFER_SIZE, newline='', encoding='utf-8')
+                write_header = True
+            except FileExistsError:
+                f = filepath.open('a', buffering=WRITE_BUFFER_SIZE, newline='', encoding='utf-8')
+                write_header = False
+        else:
+            f = filepath.open('w', buffering=WRITE_BUFFER_SIZE, newline='', encoding='utf-8')
+            write_header = True
         
-        # Determine if we need to write headers
-        file_exists = os.path.exists(filepath)
-        write_header = not (append and file_exists)
-        mode = 'a' if (append and file_exists) else 'w'
+        # Reuse the column order already written to this file so appended rows line up.
+        # The header can't grow once rows are written, so keys it lacks are reported, not written.
+        fieldnames = None
+        if not write_header:
+            fieldnames = self._csv_fieldnames.get(filepath) or self._read_csv_header(filepath)
+        if fieldnames is None:
+            fieldnames = PRIORITY_FIELDS + tuple(sorted(all_fields - PRIORITY_FIELD_SET))
+        else:
+            missing = all_fields.difference(fieldnames)
+            if missing:
+                logger.warning(f"⚠ {filepath} has no column for {', '.join(sorted(missing))}; "
+                               f"those values are only kept in the JSON export")
+        self._csv_fieldnames[filepath] = fieldnames
         
         # Write to CSV
-        with open(filepath, mode, newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+        with f:
+            writer = csv.writer(f)
             
             if write_header:
-                writer.writeheader()
+                writer.writerow(fieldnames)
             
-            writer.writerows(flattened_data)
+            # Plain list rows let the C writer skip DictWriter's per-key lookups
+            writer.writerows([item.get(field, "") for field in fieldnames] for item in flattened_data)
+        
+        logger.info(f"✓ Exported {len(data)} channel(s) to CSV: {filepath}")
         
-        print(f"✓ Exported {len(data)} channel(s) to CSV: {filepath}")
+        return str(filepath)
+    
+    def _read_csv_header(self, filepath: Path) -> Optional[tuple]:
+        """
+        Read the header row of an existing CSV file written by an earlier run.
         
-        return filepath
+        Args:
+            filepath: Path to the CSV file
+            
+        Returns:
+            Tuple of column names, or None if the file is empty
+        """
+        with filepath.open('r', newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f), None)
+        return tuple(header) if header else None
     
-    def export_both(self, data: List[Dict[str, Any]], base_filename: str = None, append: bool = True) -> tuple:
+    def export_both(self, data: List[Dict[str, Any]], base_filename: str = None, append: bool = True,
+                    jsonl: bool = False) -> tuple:
         """
         Export data to both JSON and CSV files.
         
@@ -137,18 +275,23 @@ class DataExporter:
             data: List of channel data dictionaries
             base_filename: Base filename without extension. Extensions will be added.
             append: If True, append to existing files. If False, overwrite.
+            jsonl: If True, write JSON Lines (.jsonl) instead of a JSON array (.json).
             
         Returns:
             Tuple of (json_path, csv_path)
         """
+        json_ext = "jsonl" if jsonl else "json"
         if base_filename:
-            json_file = f"{base_filename}.json"
+            json_file = f"{base_filename}.{json_ext}"
             csv_file = f"{base_filename}.csv"
         else:
             json_file = None
             csv_file = None
         
-        json_path = self.export_to_json(data, json_file, append)
+        if jsonl:
+            json_path = self.export_to_jsonl(data, json_file, append)
+        else:
+            json_path = self.export_to_json(data, json_file, append)
         csv_path = self.export_to_csv(data, csv_file, append)
         
         return json_path, csv_path
@@ -163,23 +306,30 @@ class DataExporter:
         Returns:
             List of channel data dictionaries
         """
-        filepath = os.path.join(self.output_dir, filename)
+        filepath = self.outdir / filename
         
-        if not os.path.exists(filepath):
+        try:
+            with filepath.open('rb') as f:
+                # mmap can't map an empty file; let the parser report it as invalid JSON instead
+                if orjson is not None and os.fstat(f.fileno()).st_size > 0:
+                    # Parse straight from the page cache instead of copying the file into memory
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        data = orjson.loads(view)
+                else:
+                    data = _load_json(f.read())
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {filepath}")
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            if not isinstance(data, list):
-                data = [data]
+        if not isinstance(data, list):
+            data = [data]
         
-        print(f"✓ Loaded {len(data)} channel(s) from: {filepath}")
+        logger.info(f"✓ Loaded {len(data)} channel(s) from: {filepath}")
         return data
 
 
 def test_exporter():
     """Test the data exporter."""
-    print("Testing DataExporter...\n")
+    logger.info("Testing DataExporter...\n")
     
     # Create sample data
     sample_data = [
@@ -224,16 +374,18 @@ def test_exporter():
     # Test loading
     loaded_data = exporter.load_from_json("test_channels.json")
     
-    print(f"\n✓ Test complete!")
-    print(f"  Loaded {len(loaded_data)} channels from JSON")
+    logger.info(f"\n✓ Test complete!")
+    logger.info(f"  Loaded {len(loaded_data)} channels from JSON")
     
     # Clean up test files
     import shutil
     if os.path.exists("test_output"):
         shutil.rmtree("test_output")
-        print("  Cleaned up test files")
+        logger.info("  Cleaned up test files")
 
 
 if __name__ == "__main__":
+    import config
+    config.setup_logging(verbose=True)
     test_exporter()
 
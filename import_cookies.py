@@ -4,23 +4,56 @@ Cookie importer - Convert browser cookies to Playwright format.
 This script converts cookies from browser extension format to Playwright's storage state format.
 """
 import json
+import logging
 import time
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
 
-def convert_cookies_to_playwright(browser_cookies):
+logger = logging.getLogger(__name__)
+
+
+# Browser extension sameSite values mapped to Playwright's spelling
+_SAMESITE_MAP = {
+    "no_restriction": "None",
+    "lax": "Lax",
+    "strict": "Strict",
+}
+
+# Session cookies whose expiry is reported after import
+_SESSION_COOKIE_NAMES = frozenset({"SID", "HSID", "SSID"})
+
+
+def convert_cookies_to_playwright(browser_cookies, now=None):
     """
     Convert browser extension cookies to Playwright storage state format.
     
+    Expired cookies are dropped, since Playwright would discard them anyway.
+    
     Args:
         browser_cookies: List of cookies in browser extension format
+        now: Reference timestamp for expiry checks. If None, uses the current time.
         
     Returns:
         Dictionary in Playwright storage state format
     """
     playwright_cookies = []
+    append = playwright_cookies.append
+    samesite_map = _SAMESITE_MAP
+    if now is None:
+        now = time.time()
+    expired = 0
     
     for cookie in browser_cookies:
+        # Skip expired cookies (session cookies have no expirationDate)
+        expires = cookie.get("expirationDate")
+        if expires and expires < now:
+            expired += 1
+            continue
+        
         # Convert to Playwright format
         pw_cookie = {
             "name": cookie["name"],
@@ -32,19 +65,18 @@ def convert_cookies_to_playwright(browser_cookies):
         }
         
         # Add expiration if present
-        if "expirationDate" in cookie and cookie["expirationDate"]:
-            pw_cookie["expires"] = int(cookie["expirationDate"])
+        if expires:
+            pw_cookie["expires"] = int(expires)
         
         # Add sameSite if present
-        if "sameSite" in cookie and cookie["sameSite"]:
-            sameSite = cookie["sameSite"]
-            if sameSite == "no_restriction":
-                sameSite = "None"
-            elif sameSite:
-                sameSite = sameSite.capitalize()
-            pw_cookie["sameSite"] = sameSite
+        same_site = cookie.get("sameSite")
+        if same_site:
+            pw_cookie["sameSite"] = samesite_map.get(same_site) or same_site.capitalize()
         
-        playwright_cookies.append(pw_cookie)
+        append(pw_cookie)
+    
+    if expired > 0:
+        logger.warning(f"  ⚠ Skipped {expired} expired cookie(s)")
     
     # Create Playwright storage state format
     storage_state = {
@@ -65,31 +97,30 @@ def save_cookies_to_file(browser_cookies, output_file="youtube_session.json"):
     """
     storage_state = convert_cookies_to_playwright(browser_cookies)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(storage_state, f, indent=2)
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(storage_state, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(storage_state, f, indent=2)
     
-    print(f"✓ Cookies saved to {output_file}")
-    print(f"  Total cookies: {len(storage_state['cookies'])}")
+    logger.info(f"✓ Cookies saved to {output_file}")
+    logger.info(f"  Total cookies: {len(storage_state['cookies'])}")
     
-    # Check cookie expiration
-    now = time.time()
-    expired = 0
+    # Expired cookies were dropped during conversion, so every dated cookie is valid
     valid = 0
     
     for cookie in storage_state['cookies']:
-        if 'expires' in cookie:
-            if cookie['expires'] < now:
-                expired += 1
-            else:
-                valid += 1
-                # Show when cookies expire
-                expiry_date = datetime.fromtimestamp(cookie['expires'])
-                if cookie['name'] in ['SID', 'HSID', 'SSID']:
-                    print(f"  {cookie['name']} expires: {expiry_date.strftime('%Y-%m-%d %H:%M')}")
+        expires = cookie.get('expires')
+        if expires is None:
+            continue
+        valid += 1
+        # Show when the key session cookies expire
+        if cookie['name'] in _SESSION_COOKIE_NAMES:
+            expiry_date = datetime.fromtimestamp(expires)
+            logger.info(f"  {cookie['name']} expires: {expiry_date.strftime('%Y-%m-%d %H:%M')}")
     
-    print(f"  Valid cookies: {valid}")
-    if expired > 0:
-        print(f"  ⚠ Expired cookies: {expired}")
+    logger.info(f"  Valid cookies: {valid}")
     
     return output_file
 
@@ -101,13 +132,17 @@ def import_cookies_from_json(json_file):
     Args:
         json_file: Path to JSON file with browser cookies
     """
-    with open(json_file, 'r', encoding='utf-8') as f:
-        browser_cookies = json.load(f)
+    with open(json_file, 'rb') as f:
+        raw = f.read()
+    browser_cookies = orjson.loads(raw) if orjson is not None else json.loads(raw)
     
     return save_cookies_to_file(browser_cookies)
 
 
 if __name__ == "__main__":
+    import config
+    config.setup_logging(verbose=True)
+    
     # Your YouTube cookies
     youtube_cookies = [
         {
@@ -333,9 +368,9 @@ if __name__ == "__main__":
         }
     ]
     
-    print("Converting YouTube cookies to Playwright format...")
+    logger.info("Converting YouTube cookies to Playwright format...")
     save_cookies_to_file(youtube_cookies)
-    print("\n✓ Done! You can now use the scraper with authentication.")
-    print("\nUsage:")
-    print("  python3 main.py --url 'https://www.youtube.com/@NetworkChuck'")
+    logger.info("\n✓ Done! You can now use the scraper with authentication.")
+    logger.info("\nUsage:")
+    logger.info("  python3 main.py --url 'https://www.youtube.com/@NetworkChuck'")
 
@@ -1,39 +1,81 @@
 """Main script for batch processing YouTube channel scraping."""
 import argparse
+import logging
+import os
+import queue
+import re
 import sys
-import time
-from typing import List
-from scraper import YouTubeScraper
-from data_exporter import DataExporter
-from session_manager import SessionManager
-from captcha_solver import CaptchaSolver
+import tempfile
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Iterator, List, Optional
+from urllib.parse import quote, unquote, urlparse
+from rate_limiter import RateLimiter
 import config
 
+# Playwright-backed modules are imported lazily so --help and argument
+# errors don't pay for loading them
+if TYPE_CHECKING:
+    from scraper import YouTubeScraper
+
+logger = logging.getLogger(__name__)
+
+# Channel path in any YouTube URL: @handle, /channel/UC..., /c/name or /user/name.
+# Names run to the next path, query or fragment delimiter so percent-encoded handles stay whole.
+CHANNEL_PATH_RE = re.compile(r'youtube\.com/(@[^/?#\s]+|channel/UC[\w\-]+|c/[^/?#\s]+|user/[^/?#\s]+)')
+
 
 class BatchScraper:
     """Handles batch processing of multiple YouTube channels."""
     
-    def __init__(self, output_dir: str = ".", headless: bool = None):
+    def __init__(self, output_dir: str = ".", headless: bool = None, workers: int = None,
+                 jsonl: bool = False):
         """
         Initialize batch scraper.
         
         Args:
             output_dir: Directory to save output files
             headless: Whether to run browser in headless mode
+            workers: Number of channels scraped in parallel, each with its own browser.
+                If None, uses config setting.
+            jsonl: Write results as JSON Lines instead of a JSON array
         """
         self.output_dir = output_dir
+        self.jsonl = jsonl
         self.headless = headless if headless is not None else config.HEADLESS
+        self.workers = max(1, workers or config.MAX_WORKERS)
+        
+        from scraper import YouTubeScraper
+        from data_exporter import DataExporter
+        from session_manager import SessionManager
+        from captcha_solver import CaptchaPool, CaptchaSolver
         
         self.session_manager = SessionManager()
         self.captcha_solver = CaptchaSolver()
+        if self.workers > 1:
+            # Workers share this solver; poll all of their outstanding captchas with one request
+            self.captcha_solver.pool = CaptchaPool(self.captcha_solver)
         self.scraper = YouTubeScraper(
             session_manager=self.session_manager,
             captcha_solver=self.captcha_solver
         )
         self.exporter = DataExporter(output_dir=output_dir)
         
-        self.results = []
-        self.failed_urls = []
+        # Only the writer thread appends to these while a batch is running
+        self.results = deque()
+        self.failed_urls = deque()
+        self.emails_found = deque()
+        
+        self.rate_limiter = RateLimiter(
+            config.RATE_LIMIT_PER_MINUTE,
+            jitter=config.DELAY_BETWEEN_PROFILES * 0.2
+        )
+        self.scraper.rate_limiter = self.rate_limiter
+        
+        # Workers hand outcomes to a single writer thread, which batches exports
+        self._out_q = queue.Queue(maxsize=256)
+        self._flush_every = max(1, config.EXPORT_BATCH_SIZE)
+        self._stop = threading.Event()
     
     def scrape_channels(self, channel_urls: List[str], output_filename: str = "results"):
         """
@@ -44,84 +86,324 @@ class BatchScraper:
             output_filename: Base filename for output files (without extension)
         """
         total = len(channel_urls)
-        print(f"\n{'='*60}")
-        print(f"Starting batch scrape of {total} channel(s)")
-        print(f"Output directory: {self.output_dir}")
-        print(f"Output filename: {output_filename}")
-        print(f"Headless mode: {self.headless}")
-        print(f"{'='*60}\n")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"Starting batch scrape of {total} channel(s)")
+        logger.info(f"Output directory: {self.output_dir}")
+        logger.info(f"Output filename: {output_filename}")
+        logger.info(f"Headless mode: {self.headless}")
+        logger.info(f"Parallel workers: {min(self.workers, total)}")
+        logger.info(f"{'='*60}\n")
         
-        # Start the browser
+        url_queue = queue.Queue()
+        for item in enumerate(channel_urls, 1):
+            url_queue.put(item)
+        
+        self._stop.clear()
+        
+        writer = threading.Thread(target=self._writer_loop, args=(output_filename,), daemon=True)
+        writer.start()
+        
+        try:
+            if self.workers <= 1 or total <= 1:
+                self._run_worker(self.scraper, url_queue, total, output_filename)
+            else:
+                # Accept the consent dialog once and start every worker from that state
+                shared_state = self._create_shared_state()
+                
+                # Sync Playwright objects are bound to the thread that created them,
+                # so every worker thread drives its own browser
+                threads = [
+                    threading.Thread(
+                        target=self._run_pooled_worker,
+                        args=(url_queue, total, output_filename, shared_state),
+                        daemon=True
+                    )
+                    for _ in range(min(self.workers, total))
+                ]
+                for thread in threads:
+                    thread.start()
+                
+                try:
+                    for thread in threads:
+                        while thread.is_alive():
+                            thread.join(timeout=0.5)
+                except KeyboardInterrupt:
+                    logger.warning("\n\n⚠ Interrupted by user. Saving results...")
+                    self._stop.set()
+                    for thread in threads:
+                        thread.join()
+                finally:
+                    if shared_state:
+                        os.remove(shared_state)
+        finally:
+            # Let the writer save whatever is still buffered, even if the run was aborted
+            self._out_q.put(None)
+            writer.join()
+        
+        # Print summary
+        self.print_summary(output_filename)
+    
+    def scrape_single(self, channel_url: str, output_filename: str = "results"):
+        """
+        Scrape one channel directly, without the worker queue and writer thread.
+        
+        Args:
+            channel_url: YouTube channel URL
+            output_filename: Base filename for output files (without extension)
+        """
         try:
-            print("Starting browser...")
+            logger.info("Starting browser...")
             self.scraper.start(headless=self.headless)
-            print("✓ Browser started\n")
+            logger.info("✓ Browser started\n")
         except Exception as e:
-            print(f"✗ Failed to start browser: {e}")
+            logger.error(f"✗ Failed to start browser: {e}")
             return
         
-        # Scrape each channel
-        for i, url in enumerate(channel_urls, 1):
-            print(f"\n[{i}/{total}] Processing: {url}")
-            
+        try:
+            logger.info(f"\nProcessing: {channel_url}")
+            data = self.scraper.scrape_channel(channel_url)
+        except Exception as e:
+            logger.error(f"✗ Error scraping {channel_url}: {e}")
+            data = None
+        finally:
+            logger.info("\nClosing browser...")
+            self.scraper.close()
+        
+        if data:
+            self._record_result(data)
+            self.exporter.export_both([data], base_filename=output_filename, append=True, jsonl=self.jsonl)
+        else:
+            self.failed_urls.append(channel_url)
+        
+        self.print_summary(output_filename)
+    
+    def _record_result(self, data: dict):
+        """Record a successful result and its email, if any."""
+        self.results.append(data)
+        email = data.get('email')
+        if email:
+            self.emails_found.append(email)
+    
+    def _writer_loop(self, output_filename: str):
+        """
+        Record worker outcomes and export results in batches.
+        
+        Runs in its own thread until it receives None, then writes out
+        anything still buffered. Results are also written whenever the queue
+        stays empty for a second, so slow runs don't hold them in memory.
+        
+        Args:
+            output_filename: Base filename for output files (without extension)
+        """
+        pending = []
+        
+        def flush():
             try:
-                data = self.scraper.scrape_channel(url)
-                
-                if data:
-                    self.results.append(data)
-                    print(f"✓ Successfully scraped channel {i}/{total}")
-                    
-                    # Save incrementally
-                    self.exporter.export_both([data], base_filename=output_filename, append=True)
-                else:
-                    self.failed_urls.append(url)
-                    print(f"✗ Failed to scrape channel {i}/{total}")
-                
-            except KeyboardInterrupt:
-                print("\n\n⚠ Interrupted by user. Saving results...")
-                break
+                self.exporter.export_both(pending, base_filename=output_filename, append=True,
+                                          jsonl=self.jsonl)
             except Exception as e:
-                print(f"✗ Error scraping {url}: {e}")
-                self.failed_urls.append(url)
+                logger.error(f"✗ Error saving results: {e}")
+            pending.clear()
+        
+        while True:
+            try:
+                item = self._out_q.get(timeout=1.0)
+            except queue.Empty:
+                # Workers are busy: save what is buffered so a crash or kill can't lose it
+                if pending:
+                    flush()
+                continue
+            
+            if item is None:
+                if pending:
+                    flush()
+                return
+            
+            status, value = item
+            if status == 'ok':
+                self._record_result(value)
+                pending.append(value)
+            else:
+                self.failed_urls.append(value)
             
-            # Rate limiting delay between channels
-            if i < total:
-                delay = config.DELAY_BETWEEN_PROFILES
-                print(f"Waiting {delay} seconds before next channel...")
-                time.sleep(delay)
+            if len(pending) >= self._flush_every:
+                flush()
+    
+    def _create_shared_state(self) -> Optional[str]:
+        """
+        Prepare a browser storage state for the pooled workers.
         
-        # Close browser
-        print("\nClosing browser...")
-        self.scraper.close()
+        Opens YouTube once with the main scraper, accepts the consent dialog
+        and saves cookies to a temporary file, so workers don't each have to
+        get past the banner.
         
-        # Print summary
-        self.print_summary(output_filename)
+        Returns:
+            Path to the storage state file, or None if warming up failed
+        """
+        fd, state_path = tempfile.mkstemp(prefix="youtube_state_", suffix=".json")
+        os.close(fd)
+        
+        warmed = False
+        try:
+            logger.info("Preparing shared browser session...")
+            self.scraper.start(headless=self.headless)
+            warmed = self.scraper.warm_up(state_path)
+        except Exception as e:
+            logger.warning(f"⚠ Could not prepare shared session: {e}")
+        finally:
+            self.scraper.close()
+        
+        if not warmed:
+            os.remove(state_path)
+            return None
+        return state_path
+    
+    def _run_pooled_worker(self, url_queue: queue.Queue, total: int, output_filename: str,
+                           session_file: Optional[str] = None):
+        """Run a worker thread with its own browser session."""
+        from scraper import YouTubeScraper
+        from session_manager import SessionManager
+        
+        scraper = YouTubeScraper(
+            session_manager=SessionManager(session_file=session_file),
+            captcha_solver=self.captcha_solver,
+            rate_limiter=self.rate_limiter
+        )
+        self._run_worker(scraper, url_queue, total, output_filename)
+    
+    def _run_worker(self, scraper: "YouTubeScraper", url_queue: queue.Queue, total: int, output_filename: str):
+        """
+        Scrape channels from the shared queue until it is empty.
+        
+        Args:
+            scraper: Scraper owned by this worker
+            url_queue: Queue of (index, url) tuples
+            total: Total number of channels in the batch
+            output_filename: Base filename for output files (without extension)
+        """
+        # Start the browser
+        try:
+            logger.info("Starting browser...")
+            scraper.start(headless=self.headless)
+            logger.info("✓ Browser started\n")
+        except Exception as e:
+            logger.error(f"✗ Failed to start browser: {e}")
+            return
+        
+        try:
+            while not self._stop.is_set():
+                try:
+                    i, url = url_queue.get_nowait()
+                except queue.Empty:
+                    break
+                
+                # Pace page loads across all workers; only requests over budget wait
+                wait = self.rate_limiter.reserve(urlparse(url).hostname or "")
+                if wait > 0:
+                    logger.info(f"Waiting {wait:.1f} seconds before next channel...")
+                    # Wake up immediately if the batch is stopped while waiting
+                    if self._stop.wait(wait):
+                        break
+                
+                logger.info(f"\n[{i}/{total}] Processing: {url}")
+                
+                try:
+                    data = scraper.scrape_channel(url)
+                    
+                    if data:
+                        logger.info(f"✓ Successfully scraped channel {i}/{total}")
+                        
+                        # Save incrementally
+                        self._out_q.put(('ok', data))
+                    else:
+                        logger.warning(f"✗ Failed to scrape channel {i}/{total}")
+                        self._out_q.put(('fail', url))
+                    
+                except KeyboardInterrupt:
+                    logger.warning("\n\n⚠ Interrupted by user. Saving results...")
+                    self._stop.set()
+                    break
+                except Exception as e:
+                    logger.error(f"✗ Error scraping {url}: {e}")
+                    self._out_q.put(('fail', url))
+        finally:
+            # Close browser
+            logger.info("\nClosing browser...")
+            scraper.close()
     
     def print_summary(self, output_filename: str):
         """Print scraping summary."""
-        print("\n" + "="*60)
-        print("SCRAPING SUMMARY")
-        print("="*60)
-        print(f"Total channels processed: {len(self.results) + len(self.failed_urls)}")
-        print(f"Successfully scraped: {len(self.results)}")
-        print(f"Failed: {len(self.failed_urls)}")
+        logger.info("\n" + "="*60)
+        logger.info("SCRAPING SUMMARY")
+        logger.info("="*60)
+        logger.info(f"Total channels processed: {len(self.results) + len(self.failed_urls)}")
+        logger.info(f"Successfully scraped: {len(self.results)}")
+        logger.info(f"Failed: {len(self.failed_urls)}")
         
         if self.failed_urls:
-            print("\nFailed URLs:")
+            logger.info("\nFailed URLs:")
             for url in self.failed_urls:
-                print(f"  - {url}")
+                logger.info(f"  - {url}")
         
         if self.results:
-            print(f"\n✓ Results saved to:")
-            print(f"  - {self.output_dir}/{output_filename}.json")
-            print(f"  - {self.output_dir}/{output_filename}.csv")
+            logger.info(f"\n✓ Results saved to:")
+            logger.info(f"  - {self.output_dir}/{output_filename}.{'jsonl' if self.jsonl else 'json'}")
+            logger.info(f"  - {self.output_dir}/{output_filename}.csv")
             
             # Print emails found
-            emails_found = [r.get('email') for r in self.results if r.get('email')]
-            if emails_found:
-                print(f"\n✓ Emails found: {len(emails_found)}/{len(self.results)}")
-                for email in emails_found:
-                    print(f"  - {email}")
+            if self.emails_found:
+                logger.info(f"\n✓ Emails found: {len(self.emails_found)}/{len(self.results)}")
+                for email in self.emails_found:
+                    logger.info(f"  - {email}")
+
+
+def canonical_channel_url(url: str) -> str:
+    """
+    Normalize a channel URL to https://www.youtube.com/<channel path>.
+    
+    Strips scheme/host variants (m.youtube.com, no www), tab suffixes such as
+    /videos or /featured, and query strings, so the same channel is only
+    scraped once. URLs that don't look like a channel are returned unchanged.
+    
+    Args:
+        url: Channel URL
+        
+    Returns:
+        Canonical channel URL
+    """
+    match = CHANNEL_PATH_RE.search(url)
+    if not match:
+        return url
+    # Encoded and literal spellings of the same handle (@caf%C3%A9, @café) map to one URL
+    path = quote(unquote(match.group(1)), safe='@/')
+    return f"https://www.youtube.com/{path}"
+
+
+def iter_urls(filepath: str) -> Iterator[str]:
+    """
+    Yield normalized, de-duplicated channel URLs from a text file (one URL per line).
+    
+    Args:
+        filepath: Path to the file
+        
+    Yields:
+        Channel URLs in file order, each only once
+    """
+    seen = set()
+    with open(filepath, 'r', buffering=1 << 20, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            # Skip empty lines and comments
+            if not line or line[0] == '#':
+                continue
+            # Ensure URL is properly formatted
+            if not line.startswith('http'):
+                line = f"https://www.youtube.com/{line}"
+            line = canonical_channel_url(line)
+            if line in seen:
+                continue
+            seen.add(line)
+            yield line
 
 
 def load_urls_from_file(filepath: str) -> List[str]:
@@ -132,26 +414,17 @@ def load_urls_from_file(filepath: str) -> List[str]:
         filepath: Path to the file
         
     Returns:
-        List of URLs
+        List of unique URLs
     """
-    urls = []
     try:
-        with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if line and not line.startswith('#'):
-                    # Ensure URL is properly formatted
-                    if not line.startswith('http'):
-                        line = f"https://www.youtube.com/{line}"
-                    urls.append(line)
-        print(f"✓ Loaded {len(urls)} URL(s) from {filepath}")
+        urls = list(iter_urls(filepath))
+        logger.info(f"✓ Loaded {len(urls)} URL(s) from {filepath}")
         return urls
     except FileNotFoundError:
-        print(f"✗ File not found: {filepath}")
+        logger.error(f"✗ File not found: {filepath}")
         sys.exit(1)
     except Exception as e:
-        print(f"✗ Error reading file: {e}")
+        logger.error(f"✗ Error reading file: {e}")
         sys.exit(1)
 
 
@@ -173,6 +446,9 @@ Examples:
   
   # Specify output directory
   python main.py --input channels.txt --output-dir ./results
+  
+  # Scrape 4 channels in parallel
+  python main.py --input channels.txt --workers 4
         """
     )
     
@@ -186,6 +462,8 @@ Examples:
                         help='Base filename for output files (default: results)')
     parser.add_argument('--output-dir', type=str, default='.',
                         help='Directory to save output files (default: current directory)')
+    parser.add_argument('--jsonl', action='store_true',
+                        help='Write JSON Lines (<output>.jsonl, one channel per line) instead of a JSON array')
     
     # Browser options
     parser.add_argument('--headless', action='store_true',
@@ -193,36 +471,60 @@ Examples:
     parser.add_argument('--no-headless', dest='headless', action='store_false',
                         help='Run browser with GUI (default)')
     parser.set_defaults(headless=None)
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of channels to scrape in parallel (default: MAX_WORKERS or 1)')
+    parser.add_argument('--cdp-url', type=str, default=None,
+                        help='Connect every worker to this running Chromium (http://host:port or ws:// URL) '
+                             'instead of launching a browser each')
     
     # Other options
     parser.add_argument('--debug', action='store_true',
                         help='Enable debug output')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Show per-channel progress from the scraper, solver and exporter')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Only show warnings and errors')
     
     args = parser.parse_args()
+    if args.debug:
+        config.DEBUG = True
+    if args.cdp_url:
+        config.CDP_URL = args.cdp_url
+    config.setup_logging(verbose=(args.verbose or args.debug) and not args.quiet)
+    if args.debug:
+        # Per-channel diagnostics from the scraper are logged at DEBUG
+        logging.getLogger('scraper').setLevel(logging.DEBUG)
+    # Batch progress and the summary stay visible unless --quiet is given
+    logger.setLevel(logging.WARNING if args.quiet else logging.INFO)
     
     # Get channel URLs
     if args.url:
-        channel_urls = [args.url]
+        channel_urls = [canonical_channel_url(args.url)]
     else:
         channel_urls = load_urls_from_file(args.input)
     
     if not channel_urls:
-        print("✗ No channel URLs to process")
+        logger.error("✗ No channel URLs to process")
         sys.exit(1)
     
     # Create batch scraper
     batch_scraper = BatchScraper(
         output_dir=args.output_dir,
-        headless=args.headless
+        headless=args.headless,
+        workers=args.workers,
+        jsonl=args.jsonl
     )
     
     # Run scraping
     try:
-        batch_scraper.scrape_channels(channel_urls, output_filename=args.output)
+        if len(channel_urls) == 1:
+            batch_scraper.scrape_single(channel_urls[0], output_filename=args.output)
+        else:
+            batch_scraper.scrape_channels(channel_urls, output_filename=args.output)
     except KeyboardInterrupt:
-        print("\n\n⚠ Interrupted by user")
+        logger.warning("\n\n⚠ Interrupted by user")
     except Exception as e:
-        print(f"\n✗ Fatal error: {e}")
+        logger.error(f"\n✗ Fatal error: {e}")
         if args.debug:
             import traceback
             traceback.print_exc()
@@ -230,5 +532,5 @@ Examples:
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
 
@@ -0,0 +1,80 @@
+"""Per-host token-bucket rate limiting for scraper requests."""
+import random
+import threading
+import time
+from typing import Dict, List
+
+
+class RateLimiter:
+    """Thread-safe token bucket keyed by host, shared by all scraper workers."""
+    
+    def __init__(self, rate_per_minute: float, burst: int = 1, jitter: float = 0.0):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate_per_minute: Sustained number of requests allowed per host per minute.
+                Zero or less disables limiting.
+            burst: Number of requests that may go out back-to-back before pacing starts
+            jitter: Maximum extra random delay in seconds added to each wait
+        """
+        self.rate = rate_per_minute / 60.0
+        self.burst = burst
+        self.jitter = jitter
+        self._buckets: Dict[str, List[float]] = {}  # host -> [tokens, last_update]
+        self._paused_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def acquire(self, host: str) -> float:
+        """
+        Block until a request to the host is allowed.
+        
+        Args:
+            host: Host the request goes to
+            
+        Returns:
+            Number of seconds waited
+        """
+        wait = self.reserve(host)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    def reserve(self, host: str) -> float:
+        """
+        Take a token for the host without sleeping.
+        
+        Args:
+            host: Host the request goes to
+            
+        Returns:
+            Number of seconds the caller must wait before sending the request
+        """
+        if self.rate <= 0:
+            return 0.0
+        
+        with self._lock:
+            now = time.monotonic()
+            tokens, last_update = self._buckets.get(host, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last_update) * self.rate) - 1
+            self._buckets[host] = [tokens, now]
+            
+            # Only requests beyond the budget wait, for exactly as long as needed
+            wait = -tokens / self.rate if tokens < 0 else 0.0
+            wait = max(wait, self._paused_until.get(host, 0.0) - now)
+        
+        if wait > 0 and self.jitter > 0:
+            wait += random.uniform(0, self.jitter)
+        return wait
+    
+    def pause(self, host: str, seconds: float):
+        """
+        Hold back all requests to the host, e.g. after a 429 with Retry-After.
+        
+        Args:
+            host: Host that asked us to slow down
+            seconds: How long to pause
+        """
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._paused_until[host] = max(until, self._paused_until.get(host, 0.0))
@@ -1,27 +1,259 @@
 """YouTube profile scraper core functionality."""
 import time
+import logging
 import re
 from typing import Dict, Optional, Any
-from playwright.sync_api import Page, BrowserContext, TimeoutError as PlaywrightTimeout
+from urllib.parse import urlparse
+from playwright.sync_api import Page, BrowserContext, Error as PlaywrightError, TimeoutError as PlaywrightTimeout
 from session_manager import SessionManager
 from captcha_solver import CaptchaSolver
+from rate_limiter import RateLimiter
+from asset_cache import AssetCache
 import config
 
+logger = logging.getLogger(__name__)
+
+
+# Patterns used on every scrape, compiled once
+_STATS_RE = re.compile(
+    r'(?P<subscribers>\d[\d,.]*[KkMm]?\s*subscribers?)'
+    r'|(?P<video_count>\d[\d,]*\s*videos?)'
+    r'|(?P<total_views>\d[\d,]*\s*views?)'
+    r'|(?P<joined_date>Joined\s+\w+\s+\d+,?\s*\d{4})',
+    re.I
+)
+_JOINED_FALLBACK_RE = re.compile(r'(Joined.*?\d{4})', re.I)
+_COUNTRY_RE = re.compile(
+    r'\b(United States|United Kingdom|Canada|Australia|Germany|France|Spain|Italy|Netherlands|Japan|India|Brazil)\b'
+)
+# Stat fields matched by _STATS_RE and their log labels
+_STAT_FIELDS = {
+    "subscribers": "Subscribers: ",
+    "video_count": "Videos: ",
+    "total_views": "Views: ",
+    "joined_date": "",
+}
+# Stylesheets stay enabled because visibility checks on buttons depend on them
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+# Ad and analytics hosts; nothing the scraper reads depends on them
+_BLOCKED_HOSTS = (
+    'doubleclick.net', 'google-analytics.com', 'googletagmanager.com',
+    'googlesyndication.com', 'googleadservices.com',
+)
+_CONSENT_BUTTONS = "button:has-text('Accept all'), button:has-text('Reject all')"
+# Signals waited on instead of fixed sleeps
+_ABOUT_SELECTOR = "ytd-about-channel-renderer"
+_ABOUT_CARD_SELECTOR = f"{_ABOUT_SELECTOR}, #about-container"
+_ABOUT_STATS_SELECTOR = "ytd-about-channel-renderer >> text=/Joined/"
+_VIEW_EMAIL_SELECTOR = ", ".join(
+    f"{tag}:has-text('View email'):visible" for tag in ("button", "a", "yt-button-renderer")
+)
+_VIEW_EMAIL_RE = re.compile(r'view email', re.I)
+_SUBMIT_BUTTON_SELECTOR = ", ".join(f"{selector}:visible" for selector in (
+    "button:has-text('Submit')",
+    "input[type='submit']",
+    "button[type='submit']",
+    "[aria-label*='submit' i]:has-text('Submit')",
+))
+_RECAPTCHA_FRAME_SELECTOR = "iframe[src*='recaptcha'], iframe[title*='reCAPTCHA']"
+_RECAPTCHA_ELEMENT_SELECTOR = f"{_RECAPTCHA_FRAME_SELECTOR}, .g-recaptcha, [class*='recaptcha']"
+_RECAPTCHA_RE = re.compile(r'recaptcha', re.I)
+# Where YouTube renders the address once "View email address" is revealed. The rest of the About
+# dialog (e.g. the description) may already mention addresses, so only these count as revealed.
+_REVEALED_EMAIL_SELECTOR = "#email, #email-container"
+# First address inside the revealed-email containers that isn't excluded, or null (keep polling)
+_REVEALED_EMAIL_JS = """([selector, emailPattern, excludePattern]) => {
+    const excludeRe = new RegExp(excludePattern, 'i');
+    for (const el of document.querySelectorAll(selector)) {
+        const text = el.innerText || '';
+        if (!text.includes('@')) continue;
+        for (const match of text.matchAll(new RegExp(emailPattern, 'gi'))) {
+            if (!excludeRe.test(match[0])) return match[0];
+        }
+    }
+    return null;
+}"""
+# 'captcha' once a reCAPTCHA frame is attached, 'email' once a usable address is revealed, else null
+_CAPTCHA_OR_EMAIL_JS = f"""([frameSelector, ...revealedArgs]) => document.querySelector(frameSelector) ? 'captcha'
+    : ({_REVEALED_EMAIL_JS})(revealedArgs) ? 'email' : null"""
+# Description text (trimmed and truncated to the given length), or "" if the page has none
+_DESCRIPTION_JS = """limit => {
+    const el = document.querySelector('#description-container, #description');
+    return el ? (el.innerText || '').trim().slice(0, limit) : '';
+}"""
+_DESCRIPTION_MAX_LENGTH = 500
+# Social networks recognised in channel links (case-insensitive regex, also valid in JS)
+_SOCIAL_DOMAIN_PATTERN = 'twitter|instagram|twitch|facebook|tiktok|linkedin'
+# Returns [href, text] for every matched link whose href matches the domain pattern
+_SOCIAL_LINKS_JS = """(els, pattern) => {
+    const domainRe = new RegExp(pattern, 'i');
+    return els
+        .map(e => [e.getAttribute('href'), e.innerText || e.getAttribute('aria-label') || ''])
+        .filter(([href]) => href && domainRe.test(href));
+}"""
+# Fields _extract_about_page_info always returns (social_links defaults to {})
+_ABOUT_INFO_FIELDS = ("subscribers", "video_count", "total_views", "joined_date", "country", "description")
+# Visible email check; quantifiers are capped at the RFC 5321 local-part and domain lengths and the
+# longest TLD, so long runs of dots or word characters can't make the match backtrack unboundedly
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Za-z]{2,24}\b')
+# Substrings marking addresses that are never the channel's contact email
+_EMAIL_EXCLUDES = ('noreply@', 'example@', 'test@', '@youtube', '@google')
+# Once the email is revealed, site-wide contact addresses are excluded as well
+_PAGE_EMAIL_EXCLUDES = _EMAIL_EXCLUDES + ('support@', 'privacy@', 'copyright@')
+_EMAIL_EXCLUDE_RE = re.compile('|'.join(map(re.escape, _EMAIL_EXCLUDES)), re.I)
+# More permissive pattern used once the email has been revealed. Quantifiers are bounded and the
+# domain is matched label by label, so long runs of word characters or dots can't backtrack badly.
+_PAGE_EMAIL_RE = re.compile(
+    r'\b[A-Za-z0-9][A-Za-z0-9._%+\-]{0,62}'
+    r'@[A-Za-z0-9](?:[A-Za-z0-9\-]{0,61}[A-Za-z0-9])?'
+    r'(?:\.[A-Za-z0-9](?:[A-Za-z0-9\-]{0,61}[A-Za-z0-9])?)*'
+    r'\.[A-Za-z]{2,24}\b',
+    re.I
+)
+_PAGE_EMAIL_EXCLUDE_RE = re.compile('|'.join(map(re.escape, _PAGE_EMAIL_EXCLUDES)), re.I)
+_HANDLE_RE = re.compile(r'/@([^/]+)')
+_SITEKEY_RE = re.compile(
+    r'data-sitekey="([^"]+)"'
+    r'|sitekey["\s:]+([A-Za-z0-9_-]{40,})'
+    r'|"sitekey"\s*:\s*"([^"]+)"'
+)
+
+# Fills every g-recaptcha-response field with the solution token, then calls the widget's
+# registered callback (or its data-callback) in the same task.
+# Returns {injected: <fields filled>, calledBack: <whether a callback ran>}
+_SUBMIT_SOLUTION_JS = """solution => {
+    // Simple name/id/class lookups instead of matching a compound selector against the whole DOM
+    const byId = document.getElementById('g-recaptcha-response');
+    const textareas = new Set([
+        ...document.getElementsByName('g-recaptcha-response'),
+        ...(byId ? [byId] : []),
+        ...document.getElementsByClassName('g-recaptcha-response'),
+    ]);
+    for (const textarea of textareas) {
+        textarea.innerHTML = solution;
+        textarea.value = solution;
+        textarea.style.display = 'block';
+    }
+    const result = {injected: textareas.size, calledBack: false};
+    
+    // Method 1: Try standard callback
+    if (typeof ___grecaptcha_cfg !== 'undefined') {
+        const clients = ___grecaptcha_cfg.clients;
+        for (const id in clients) {
+            if (clients[id] && clients[id].callback) {
+                clients[id].callback(solution);
+                result.calledBack = true;
+                return result;
+            }
+        }
+    }
+    
+    // Method 2: Try to find and execute callback from data attribute
+    const recaptchaElement = document.querySelector('.g-recaptcha');
+    if (recaptchaElement) {
+        const callback = recaptchaElement.getAttribute('data-callback');
+        if (callback && typeof window[callback] === 'function') {
+            window[callback](solution);
+            result.calledBack = true;
+        }
+    }
+    
+    return result;
+}"""
+
+# Containers the revealed email is rendered into, in the order they are searched
+_EMAIL_MODAL_SELECTORS = [
+    '[role="dialog"]',
+    '.ytd-about-channel-renderer',
+    'ytd-about-channel-renderer',
+    '#content-container',
+    'yt-formatted-string',
+]
+# Matches a regex against the document HTML; returns the first non-empty group or the match
+_SEARCH_HTML_JS = """([pattern, flags]) => {
+    const match = document.documentElement.outerHTML.match(new RegExp(pattern, flags));
+    return match ? (match.slice(1).find(group => group) || match[0]) : null;
+}"""
+# Searches the revealed-email container, then the body text, then the visible containers, then the
+# full HTML, all inside the page. Returns [where, email] for the first email that isn't excluded, or null.
+_FIND_EMAIL_JS = """([revealedSelector, selectors, emailPattern, excludePattern]) => {
+    const excludeRe = new RegExp(excludePattern, 'i');
+    const firstValid = text => {
+        // Most containers hold no address at all; skip the regex for those
+        if (!text || !text.includes('@')) return null;
+        for (const match of text.matchAll(new RegExp(emailPattern, 'gi'))) {
+            if (!excludeRe.test(match[0])) return match[0];
+        }
+        return null;
+    };
+    
+    // Method 1: The container YouTube reveals the address in
+    let email = null;
+    for (const el of document.querySelectorAll(revealedSelector)) {
+        email = firstValid(el.innerText);
+        if (email) return ['revealed email', email];
+    }
+    
+    // Method 2: Visible text (most reliable after form submit)
+    email = firstValid(document.body.innerText);
+    if (email) return ['visible text', email];
+    
+    // Method 3: Modal/dialog elements that appear after submit
+    for (const selector of selectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            const visible = el.checkVisibility ? el.checkVisibility() : el.getClientRects().length > 0;
+            if (!visible) continue;
+            email = firstValid(el.innerText);
+            if (email) return [`element: ${selector}`, email];
+        }
+    }
+    
+    // Method 4: Page HTML content
+    email = firstValid(document.documentElement.outerHTML);
+    return email ? ['HTML', email] : null;
+}"""
+
+
+def _first_valid_email(text: str) -> Optional[str]:
+    """Return the first revealed-email match in text that isn't a known false positive."""
+    if '@' not in text:
+        return None
+    for match in _PAGE_EMAIL_RE.finditer(text):
+        email = match.group()
+        if not _PAGE_EMAIL_EXCLUDE_RE.search(email):
+            return email
+    return None
+
+
+def _match_stats(text: str) -> Dict[str, str]:
+    """Find the first subscribers, video count, views and join date match in one pass over text."""
+    stats = {}
+    for match in _STATS_RE.finditer(text):
+        stats.setdefault(match.lastgroup, match.group())
+        if len(stats) == len(_STAT_FIELDS):
+            break
+    return stats
+
 
 class YouTubeScraper:
     """Scrapes YouTube channel profile information."""
     
-    def __init__(self, session_manager: SessionManager = None, captcha_solver: CaptchaSolver = None):
+    def __init__(self, session_manager: SessionManager = None, captcha_solver: CaptchaSolver = None,
+                 rate_limiter: RateLimiter = None):
         """
         Initialize the scraper.
         
         Args:
             session_manager: SessionManager instance. If None, creates a new one.
             captcha_solver: CaptchaSolver instance. If None, creates a new one.
+            rate_limiter: Shared RateLimiter to notify when YouTube asks us to slow down.
         """
         self.session_manager = session_manager or SessionManager()
         self.captcha_solver = captcha_solver or CaptchaSolver()
+        self.rate_limiter = rate_limiter
+        self.asset_cache = None
         self.context = None
+        self.page = None
     
     def start(self, headless: bool = None, use_session: bool = True):
         """
@@ -32,10 +264,32 @@ class YouTubeScraper:
             use_session: Use saved cookies for authentication (default: True)
         """
         _, self.context = self.session_manager.start_browser(headless=headless, use_session=use_session)
+        
+        if config.ASSET_CACHE_FILE and self.asset_cache is None:
+            self.asset_cache = AssetCache(config.ASSET_CACHE_FILE)
+        
+        # Only the HTML and scripts are needed, so skip downloading thumbnails, video and fonts
+        self.context.route("**/*", self._route_request)
+    
+    def _route_request(self, route):
+        """Abort requests the scraper never reads and serve static assets from the cache."""
+        request = route.request
+        if (request.resource_type in _BLOCKED_RESOURCE_TYPES
+                or (urlparse(request.url).hostname or "").endswith(_BLOCKED_HOSTS)):
+            route.abort()
+        elif (self.asset_cache and AssetCache.is_cacheable(request.url, request.resource_type)
+              and self.asset_cache.handle_route(route)):
+            return
+        else:
+            route.continue_()
     
     def close(self):
         """Close the browser and clean up."""
+        self.page = None
         self.session_manager.close()
+        if self.asset_cache:
+            self.asset_cache.close()
+            self.asset_cache = None
     
     def scrape_channel(self, channel_url: str) -> Optional[Dict[str, Any]]:
         """
@@ -50,27 +304,41 @@ class YouTubeScraper:
         if not self.context:
             raise RuntimeError("Browser not started. Call start() first.")
         
-        print(f"\n{'='*60}")
-        print(f"Scraping: {channel_url}")
-        print(f"{'='*60}\n")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"Scraping: {channel_url}")
+        logger.info(f"{'='*60}\n")
         
-        page = self.context.new_page()
+        # Reuse this scraper's tab across channels; navigating it replaces the previous page
+        if self.page is None or self.page.is_closed():
+            self.page = self.context.new_page()
+        page = self.page
+        # Stays None if the scrape fails before any data is collected
+        data = None
         
         try:
             # Navigate to channel About page (not featured page)
-            print("1. Navigating to channel About page...")
+            logger.info("1. Navigating to channel About page...")
             
             # Convert URL to about page if needed
             about_url = channel_url.rstrip('/') + '/about'
             if '/featured' in about_url:
                 about_url = about_url.replace('/featured', '/about')
             
-            page.goto(about_url, wait_until="domcontentloaded", timeout=30000)
-            page.wait_for_timeout(3000)  # Wait for dynamic content
+            # Return as soon as the response arrives; the waits below cover rendering
+            response = page.goto(about_url, wait_until="commit", timeout=30000)
+            if response and response.status == 429:
+                self._handle_rate_limited(about_url, response.headers.get('retry-after'))
+                # The page is YouTube's error page, so there is nothing to extract
+                return None
+            # Wait for the About dialog (or a consent prompt) instead of a fixed delay
+            self._wait_for_selector(page, f"{_ABOUT_SELECTOR}, {_CONSENT_BUTTONS}", 10000)
             
             # Handle YouTube consent dialog if it appears
             self._handle_consent_dialog(page)
             
+            # Snapshot the text once for the stats extractor
+            page_text = self._about_snapshot(page)
+            
             # Initialize data dictionary
             data = {
                 "channel_url": channel_url,
@@ -79,75 +347,191 @@ class YouTubeScraper:
             }
             
             # Extract information from About page (no need to click 'more' button)
-            print("2. Extracting channel information from About page...")
-            channel_info = self._extract_about_page_info(page)
+            logger.info("2. Extracting channel information from About page...")
+            channel_info = self._extract_about_page_info(page, page_text)
             data.update(channel_info)
             
             # Try to get email address
-            print("3. Attempting to extract email...")
+            logger.info("3. Attempting to extract email...")
             email = self._extract_email_from_about(page)
             data["email"] = email
             
-            print(f"\n✓ Successfully scraped channel: {data.get('channel_name', 'Unknown')}")
+            logger.info(f"\n✓ Successfully scraped channel: {data.get('channel_name', 'Unknown')}")
             
             return data
             
         except Exception as e:
-            print(f"✗ Error scraping channel: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"✗ Error scraping channel: {e}", exc_info=config.DEBUG)
+            # Start the next channel on a fresh tab in case this one is stuck mid-dialog
+            page.close()
             return data
+    
+    def warm_up(self, state_path: str) -> bool:
+        """
+        Open YouTube once, get past the consent dialog and save the session state.
+        
+        Args:
+            state_path: File to write the Playwright storage state to
             
+        Returns:
+            True if the state was saved
+        """
+        if not self.context:
+            raise RuntimeError("Browser not started. Call start() first.")
+        
+        page = self.context.new_page()
+        try:
+            page.goto("https://www.youtube.com/", wait_until="domcontentloaded", timeout=30000)
+            self._handle_consent_dialog(page)
+            self.context.storage_state(path=state_path)
+            return True
+        except Exception as e:
+            logger.warning(f"  ⚠ Could not warm up session: {e}")
+            return False
         finally:
             page.close()
     
+    def _handle_rate_limited(self, url: str, retry_after: Optional[str]):
+        """Pause further requests to the host after an HTTP 429 response."""
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = 60.0
+        
+        logger.warning(f"  ⚠ Rate limited by YouTube, pausing requests for {delay:.0f}s")
+        if self.rate_limiter:
+            self.rate_limiter.pause(urlparse(url).hostname or "", delay)
+    
+    def _wait_for_selector(self, page: Page, selector: str, timeout: float) -> bool:
+        """Wait up to timeout ms for selector to become visible; returns False if it never does."""
+        try:
+            page.wait_for_selector(selector, timeout=timeout)
+            return True
+        except PlaywrightTimeout:
+            return False
+    
+    def _about_text(self, page: Page) -> Optional[str]:
+        """Return the visible text of the About card, or None if it isn't on the page."""
+        # The callers have already waited for the About dialog, so probe without waiting again
+        try:
+            card = page.query_selector(_ABOUT_CARD_SELECTOR)
+            return card.inner_text() if card else None
+        except PlaywrightError:
+            return None
+    
+    def _about_snapshot(self, page: Page) -> str:
+        """
+        Read the smallest page text that carries the channel stats.
+        
+        The About card's text is a few KB against megabytes of serialized HTML, so it is tried
+        first. The server-rendered payload in the HTML often has stats the card hasn't drawn yet;
+        only when neither has them all is the rendered stats row waited for.
+        
+        Args:
+            page: Page showing the channel About page
+            
+        Returns:
+            About card text, or the page HTML when the card is missing or incomplete
+        """
+        text = self._about_text(page)
+        if text and len(_match_stats(text)) == len(_STAT_FIELDS):
+            return text
+        
+        html = page.content()
+        if len(_match_stats(html)) == len(_STAT_FIELDS):
+            return html
+        
+        if self._wait_for_selector(page, _ABOUT_STATS_SELECTOR, 5000):
+            return self._about_text(page) or page.content()
+        return html
+    
+    def _wait_for_email(self, page: Page, timeout: float) -> bool:
+        """Wait up to timeout ms for the revealed email address to show up in its container."""
+        try:
+            page.wait_for_function(_REVEALED_EMAIL_JS, arg=[
+                _REVEALED_EMAIL_SELECTOR, _PAGE_EMAIL_RE.pattern, _PAGE_EMAIL_EXCLUDE_RE.pattern
+            ], timeout=timeout)
+            return True
+        except PlaywrightTimeout:
+            return False
+    
+    def _wait_for_captcha_or_email(self, page: Page, timeout: float) -> Optional[str]:
+        """Wait up to timeout ms for a reCAPTCHA frame or a revealed email; returns 'captcha', 'email' or None."""
+        try:
+            return page.wait_for_function(
+                _CAPTCHA_OR_EMAIL_JS, arg=[
+                    _RECAPTCHA_FRAME_SELECTOR, _REVEALED_EMAIL_SELECTOR,
+                    _PAGE_EMAIL_RE.pattern, _PAGE_EMAIL_EXCLUDE_RE.pattern
+                ], timeout=timeout
+            ).json_value()
+        except PlaywrightTimeout:
+            return None
+    
+    def _search_html(self, page: Page, pattern: re.Pattern) -> Optional[str]:
+        """
+        Run a regex over the page HTML inside the browser, so the document is never serialized.
+        
+        Args:
+            page: Page to search
+            pattern: Compiled pattern (JS-compatible syntax; only the IGNORECASE flag is carried over)
+            
+        Returns:
+            First non-empty capture group (or the whole match if it has none), or None
+        """
+        flags = 'i' if pattern.flags & re.I else ''
+        return page.evaluate(_SEARCH_HTML_JS, [pattern.pattern, flags])
+    
     def _extract_handle_from_url(self, url: str) -> str:
         """Extract channel handle from URL."""
-        match = re.search(r'/@([^/]+)', url)
+        match = _HANDLE_RE.search(url)
         return match.group(1) if match else ""
     
     def _handle_consent_dialog(self, page: Page):
         """Handle YouTube consent/cookie dialog if it appears."""
         try:
-            # Check if we're on a consent page
-            if 'consent.youtube.com' in page.url or 'Before you continue' in page.content():
-                print("  Handling consent dialog...")
+            # Check if we're on a consent page, or an in-page dialog offers the consent buttons.
+            # Probing the buttons avoids serializing the whole DOM when there is no dialog.
+            if 'consent.' in page.url or page.locator(_CONSENT_BUTTONS).count() > 0:
+                logger.info("  Handling consent dialog...")
                 
                 # Try to click "Accept all" or "Reject all" button
                 accept_buttons = [
                     "button:has-text('Accept all')",
                     "button:has-text('Reject all')",
                     "[aria-label*='Accept']",
-                    "//button[contains(text(), 'Accept')]"
+                    "button:has-text('Accept')"
                 ]
                 
                 for selector in accept_buttons:
                     try:
-                        if selector.startswith('//'):
-                            button = page.locator(f"xpath={selector}").first
-                        else:
-                            button = page.locator(selector).first
-                        
-                        if button.count() > 0:
+                        # query_selector returns None straight away when nothing matches
+                        button = page.query_selector(selector)
+                        if button:
                             button.click(timeout=5000)
                             page.wait_for_timeout(2000)
-                            print("  ✓ Consent dialog handled")
+                            logger.info("  ✓ Consent dialog handled")
                             return
-                    except:
+                    except PlaywrightError:
                         continue
                 
-                print("  ⚠ Could not handle consent dialog automatically")
-        except:
+                logger.warning("  ⚠ Could not handle consent dialog automatically")
+        except PlaywrightError:
             pass  # No consent dialog or already handled
     
-    def _extract_about_page_info(self, page: Page) -> Dict[str, Any]:
+    def _extract_about_page_info(self, page: Page, page_text: str = None) -> Dict[str, Any]:
         """
         Extract channel information from the About page.
         
+        Args:
+            page: Page showing the channel About page
+            page_text: About card text or page HTML to match stats in. If None, it is read from the page.
+            
         Returns:
             Dictionary with channel info
         """
-        info = {}
+        # Every field except the name defaults to empty; extraction below only overwrites
+        info = dict.fromkeys(_ABOUT_INFO_FIELDS, "")
+        info["social_links"] = {}
         
         try:
             # Extract channel name from page title or header
@@ -157,344 +541,55 @@ class YouTubeScraper:
                 if ' - YouTube' in title:
                     name = title.replace(' - YouTube', '').strip()
                     info["channel_name"] = name
-                    print(f"  Name: {info['channel_name']}")
-            except:
+                    logger.info(f"  Name: {info['channel_name']}")
+            except PlaywrightError:
                 info["channel_name"] = ""
             
             # Extract stats from the About page table
             # The info is displayed in rows with specific text patterns
+            if page_text is None:
+                page_text = self._about_snapshot(page)
             
-            # Wait a bit more for stats to load
-            page.wait_for_timeout(2000)
+            # Extract all stats in one pass over the text
+            stats = _match_stats(page_text)
             
-            # Get all text content and use regex to extract info
-            page_text = page.content()
+            # Fall back to the looser join date pattern (e.g. "Joined 27 Apr 2014")
+            if "joined_date" not in stats:
+                match = _JOINED_FALLBACK_RE.search(page_text)
+                if match:
+                    stats["joined_date"] = match.group(1)
             
-            # Try to extract subscribers with regex
-            if not info.get("subscribers"):
-                subs_patterns = [
-                    r'([\d,.]+[KkMm]?\s*subscribers?)',
-                    r'(\d+[\d,.]*[KkMm]?\s*subscribers?)'
-                ]
-                for pattern in subs_patterns:
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        info["subscribers"] = match.group(1)
-                        print(f"  Subscribers: {info['subscribers']}")
-                        break
-            
-            # Try to extract video count
-            if not info.get("video_count"):
-                video_patterns = [
-                    r'(\d+[\d,]*\s*videos?)',
-                    r'([\d,.]+\s*videos?)'
-                ]
-                for pattern in video_patterns:
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        info["video_count"] = match.group(1)
-                        print(f"  Videos: {info['video_count']}")
-                        break
-            
-            # Try to extract views
-            if not info.get("total_views"):
-                views_patterns = [
-                    r'([\d,]+\s*views?)',
-                    r'(\d+[\d,]*\s*views?)'
-                ]
-                for pattern in views_patterns:
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        info["total_views"] = match.group(1)
-                        print(f"  Views: {info['total_views']}")
-                        break
-            
-            # Try to extract join date
-            if not info.get("joined_date"):
-                joined_patterns = [
-                    r'(Joined\s+\w+\s+\d+,?\s*\d{4})',
-                    r'(Joined.*?\d{4})'
-                ]
-                for pattern in joined_patterns:
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        info["joined_date"] = match.group(1)
-                        print(f"  {info['joined_date']}")
-                        break
+            for field, label in _STAT_FIELDS.items():
+                if field in stats:
+                    info[field] = stats[field]
+                    logger.info(f"  {label}{info[field]}")
             
             # Try to extract country from common locations
-            if not info.get("country"):
-                countries = ['United States', 'United Kingdom', 'Canada', 'Australia', 'Germany', 'France', 'Spain', 'Italy', 'Netherlands', 'Japan', 'India', 'Brazil']
-                for country in countries:
-                    if country in page_text:
-                        info["country"] = country
-                        print(f"  Location: {country}")
-                        break
-            
-            # Set default empty values for missing fields
-            if "subscribers" not in info:
-                info["subscribers"] = ""
-            if "video_count" not in info:
-                info["video_count"] = ""
-            if "total_views" not in info:
-                info["total_views"] = ""
-            if "joined_date" not in info:
-                info["joined_date"] = ""
-            if "country" not in info:
-                info["country"] = ""
-            
-            # Extract description
-            try:
-                # Look for description in the About page
-                desc_container = page.locator('#description-container, #description').first
-                if desc_container.count() > 0:
-                    desc = desc_container.inner_text(timeout=2000)
-                    info["description"] = desc.strip()[:500]  # Limit to 500 chars
-                else:
-                    info["description"] = ""
-            except:
-                info["description"] = ""
-            
-            # Extract social media links
-            info["social_links"] = {}
-            try:
-                # Look for links in the channel links section
-                links = page.locator('a[href]').all()
-                for link in links:
-                    try:
-                        href = link.get_attribute('href')
-                        if href and any(domain in href.lower() for domain in ['twitter', 'instagram', 'twitch', 'facebook', 'tiktok', 'linkedin']):
-                            # Get the link text or aria-label
-                            try:
-                                text = link.inner_text(timeout=500)
-                                if not text:
-                                    text = link.get_attribute('aria-label') or href
-                                text = text.strip()
-                                if text and len(text) < 100:  # Reasonable label length
-                                    info["social_links"][text] = href
-                            except:
-                                pass
-                    except:
-                        continue
-            except:
-                pass
-            
-        except Exception as e:
-            print(f"  ⚠ Error extracting channel info: {e}")
-        
-        return info
-    
-    def _click_more_button(self, page: Page) -> bool:
-        """
-        Click the 'more' button to expand channel description.
-        
-        Returns:
-            True if successful
-        """
-        try:
-            # Look for the "more" button/link in the channel header description
-            # YouTube uses various selectors, try multiple approaches
-            selectors = [
-                "button[aria-label*='more']",
-                "tp-yt-paper-button#expand",
-                "#description-container button",
-                "//button[contains(text(), 'more')]",
-                "//span[contains(text(), 'more')]/..",
-            ]
-            
-            for selector in selectors:
-                try:
-                    if selector.startswith('//'):
-                        # XPath selector
-                        button = page.locator(f"xpath={selector}").first
-                    else:
-                        button = page.locator(selector).first
-                    
-                    if button.count() > 0 and button.is_visible(timeout=2000):
-                        button.click(timeout=5000)
-                        page.wait_for_timeout(1000)
-                        print("  ✓ Clicked 'more' button")
-                        
-                        # Wait for modal/popup to appear
-                        page.wait_for_selector('tp-yt-paper-dialog', timeout=5000)
-                        return True
-                except:
-                    continue
-            
-            print("  ⚠ 'More' button not found, trying alternative...")
-            
-            # Alternative: Look for channel name/avatar to click
-            try:
-                # Click on channel name or avatar which also opens the modal
-                channel_name = page.locator('#channel-name a').first
-                if channel_name.count() > 0:
-                    channel_name.click()
-                    page.wait_for_timeout(1000)
-                    page.wait_for_selector('tp-yt-paper-dialog', timeout=5000)
-                    print("  ✓ Opened channel info via channel name")
-                    return True
-            except:
-                pass
-            
-            return False
-            
-        except Exception as e:
-            print(f"  ✗ Error clicking more button: {e}")
-            return False
-    
-    def _extract_channel_info(self, page: Page) -> Dict[str, Any]:
-        """
-        Extract channel information from the open modal.
-        
-        Returns:
-            Dictionary with channel info
-        """
-        info = {}
-        
-        try:
-            # Wait for modal to be visible
-            page.wait_for_selector('tp-yt-paper-dialog', timeout=5000)
-            
-            # Extract channel name
-            try:
-                name = page.locator('#channel-title').first.inner_text(timeout=2000)
-                info["channel_name"] = name.strip()
-                print(f"  Name: {info['channel_name']}")
-            except:
-                info["channel_name"] = ""
-            
-            # Extract subscriber count
-            try:
-                # Look for subscriber count in the modal
-                subs_selectors = [
-                    "#subscriber-count",
-                    "yt-formatted-string:has-text('subscriber')",
-                    "[id='subscriber-count']"
-                ]
-                for selector in subs_selectors:
-                    try:
-                        subs = page.locator(selector).first.inner_text(timeout=2000)
-                        info["subscribers"] = subs.strip()
-                        print(f"  Subscribers: {info['subscribers']}")
-                        break
-                    except:
-                        continue
-                if "subscribers" not in info:
-                    info["subscribers"] = ""
-            except:
-                info["subscribers"] = ""
-            
-            # Extract video count
-            try:
-                videos_selectors = [
-                    "yt-formatted-string:has-text('video')",
-                    "#videos-count"
-                ]
-                for selector in videos_selectors:
-                    try:
-                        videos = page.locator(selector).first.inner_text(timeout=2000)
-                        info["video_count"] = videos.strip()
-                        print(f"  Videos: {info['video_count']}")
-                        break
-                    except:
-                        continue
-                if "video_count" not in info:
-                    info["video_count"] = ""
-            except:
-                info["video_count"] = ""
-            
-            # Extract total views
-            try:
-                views_selectors = [
-                    "yt-formatted-string:has-text('views')",
-                    "#view-count"
-                ]
-                for selector in views_selectors:
-                    try:
-                        views = page.locator(selector).first.inner_text(timeout=2000)
-                        info["total_views"] = views.strip()
-                        print(f"  Views: {info['total_views']}")
-                        break
-                    except:
-                        continue
-                if "total_views" not in info:
-                    info["total_views"] = ""
-            except:
-                info["total_views"] = ""
-            
-            # Extract join date
-            try:
-                joined_selectors = [
-                    "yt-formatted-string:has-text('Joined')",
-                    "#joined-date"
-                ]
-                for selector in joined_selectors:
-                    try:
-                        joined = page.locator(selector).first.inner_text(timeout=2000)
-                        info["joined_date"] = joined.strip()
-                        print(f"  {info['joined_date']}")
-                        break
-                    except:
-                        continue
-                if "joined_date" not in info:
-                    info["joined_date"] = ""
-            except:
-                info["joined_date"] = ""
-            
-            # Extract country/location
-            try:
-                country_selectors = [
-                    "#country",
-                    "yt-formatted-string:has-text('United States')",  # Common, but varies
-                ]
-                for selector in country_selectors:
-                    try:
-                        country = page.locator(selector).first.inner_text(timeout=2000)
-                        info["country"] = country.strip()
-                        print(f"  Location: {info['country']}")
-                        break
-                    except:
-                        continue
-                if "country" not in info:
-                    info["country"] = ""
-            except:
-                info["country"] = ""
+            match = _COUNTRY_RE.search(page_text)
+            if match:
+                info["country"] = match.group(1)
+                logger.info(f"  Location: {info['country']}")
             
             # Extract description
             try:
-                desc_selectors = [
-                    "#description-container",
-                    "#description"
-                ]
-                for selector in desc_selectors:
-                    try:
-                        desc = page.locator(selector).first.inner_text(timeout=2000)
-                        info["description"] = desc.strip()[:500]  # Limit to 500 chars
-                        break
-                    except:
-                        continue
-                if "description" not in info:
-                    info["description"] = ""
-            except:
+                # Look for description in the About page, truncated in the browser
+                info["description"] = page.evaluate(_DESCRIPTION_JS, _DESCRIPTION_MAX_LENGTH)
+            except PlaywrightError:
                 info["description"] = ""
             
             # Extract social media links
-            info["social_links"] = {}
             try:
-                links = page.locator('tp-yt-paper-dialog a[href]').all()
-                for link in links:
-                    try:
-                        href = link.get_attribute('href')
-                        text = link.inner_text()
-                        if href and any(domain in href.lower() for domain in ['twitter', 'instagram', 'twitch', 'facebook', 'tiktok']):
-                            info["social_links"][text or href] = href
-                    except:
-                        continue
-            except:
+                # Collect matching links with their text or aria-label in a single round trip
+                links = page.eval_on_selector_all('a[href]', _SOCIAL_LINKS_JS, _SOCIAL_DOMAIN_PATTERN)
+                for href, text in links:
+                    text = (text or href).strip()
+                    if text and len(text) < 100:  # Reasonable label length
+                        info["social_links"][text] = href
+            except PlaywrightError:
                 pass
             
         except Exception as e:
-            print(f"  ⚠ Error extracting channel info: {e}")
+            logger.warning(f"  ⚠ Error extracting channel info: {e}")
         
         return info
     
@@ -506,101 +601,75 @@ class YouTubeScraper:
             Email address or None
         """
         try:
-            # Wait a bit for page to fully load
-            page.wait_for_timeout(2000)
-            
-            # Look for "View email address" link/button or "Sign in to see email"
-            page_text = page.inner_text('body')
+            # Visible text only: scripts and JSON blobs in the HTML are a source of false matches.
+            # The About card holds the email affordance, so the rest of the page isn't needed.
+            body_text = self._about_text(page) or page.inner_text('body')
             
             # Check for sign-in requirement (more specific check)
-            if 'Sign in to see email address' in page_text:
-                print("  ⚠ Email requires sign-in (not logged in to YouTube)")
+            if 'Sign in to see email address' in body_text:
+                logger.warning("  ⚠ Email requires sign-in (not logged in to YouTube)")
                 return None
             
             # First check if email is already visible (happens after authentication sometimes)
-            page_content = page.content()
-            email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', page_content)
-            if email_match:
+            for email_match in _EMAIL_RE.finditer(body_text):
                 email = email_match.group(0)
                 # Filter out common false positives
-                if not any(ex in email.lower() for ex in ['noreply@', 'example@', 'test@', '@youtube', '@google']):
-                    print(f"  ✓ Email already visible: {email}")
+                if not _EMAIL_EXCLUDE_RE.search(email):
+                    logger.info(f"  ✓ Email already visible: {email}")
                     return email
             
+            # Skip the DOM lookup entirely when the page has no email affordance at all
+            if not _VIEW_EMAIL_RE.search(body_text):
+                logger.info("  ⚠ No 'View email address' button on page (channel may not have public email)")
+                return None
+            
             # Look for "View email address" button/link - try multiple selectors
-            print("  Looking for 'View email address' button...")
-            email_selectors = [
-                "text=/View email address/i",
-                "button:has-text('View email')",
-                "a:has-text('View email')",
-                "[aria-label*='email' i]",
-                "yt-button-renderer:has-text('View email')",
-                "a.yt-simple-endpoint:has-text('email')",
-            ]
-            
-            email_button = None
-            for selector in email_selectors:
-                try:
-                    buttons = page.locator(selector).all()
-                    for button in buttons:
-                        try:
-                            if button.is_visible(timeout=1000):
-                                button_text = button.inner_text(timeout=1000).lower()
-                                if 'view' in button_text and 'email' in button_text:
-                                    email_button = button
-                                    print(f"  ✓ Found 'View email address' button")
-                                    break
-                        except:
-                            continue
-                    if email_button:
-                        break
-                except:
-                    continue
+            logger.info("  Looking for 'View email address' button...")
+            # One query for the first visible button or link whose text mentions "View email"
+            email_button = page.query_selector(_VIEW_EMAIL_SELECTOR)
+            if email_button:
+                logger.info(f"  ✓ Found 'View email address' button")
             
             if not email_button:
-                print("  ⚠ 'View email address' button not found (channel may not have public email)")
+                logger.info("  ⚠ 'View email address' button not found (channel may not have public email)")
                 return None
             
             # Click the button
-            print("  Clicking 'View email address' button...")
+            logger.info("  Clicking 'View email address' button...")
             try:
                 email_button.click(timeout=5000)
-                print("  Button clicked, waiting for response...")
-                page.wait_for_timeout(5000)  # Wait longer for content to load/modal to appear
+                logger.info("  Button clicked, waiting for response...")
             except Exception as e:
-                print(f"  ✗ Error clicking button: {e}")
+                logger.warning(f"  ✗ Error clicking button: {e}")
                 return None
             
-            # Check if reCAPTCHA appeared
-            print("  Checking for reCAPTCHA...")
-            page.wait_for_timeout(2000)  # Give time for captcha to load if it will
+            # Branch as soon as either a reCAPTCHA or the email itself shows up
+            logger.info("  Checking for reCAPTCHA...")
+            outcome = self._wait_for_captcha_or_email(page, 7000)
             
-            if self._has_recaptcha(page):
-                print("  ✓ reCAPTCHA detected, solving...")
-                success = self._solve_recaptcha(page)
-                if not success:
-                    print("  ✗ Failed to solve reCAPTCHA")
+            captcha_tried = outcome == 'captcha' or (outcome is None and self._has_recaptcha(page))
+            if captcha_tried:
+                logger.info("  ✓ reCAPTCHA detected, solving...")
+                if not self._solve_and_wait_for_email(page):
                     return None
-                print("  ✓ reCAPTCHA solved and submitted, waiting for email to appear...")
-                page.wait_for_timeout(8000)  # Wait longer for email to load after submit
-                
-                # Try to wait for email to appear in the page
-                try:
-                    # Wait for text content to change (indicates page updated)
-                    page.wait_for_function("document.body.innerText.length > 1000", timeout=5000)
-                except:
-                    pass
-            else:
-                print("  No reCAPTCHA detected, email should be visible now...")
-                page.wait_for_timeout(3000)  # Give more time for email to appear
+            elif outcome is None:
+                logger.info("  No reCAPTCHA detected, email should be visible now...")
+                self._wait_for_email(page, 5000)
             
             # Extract email from the page (multiple attempts)
             email = self._find_email_on_page(page)
             
+            # Nothing usable was revealed; a reCAPTCHA that loaded late may still be in the way
+            if not email and not captcha_tried and self._has_recaptcha(page):
+                logger.info("  ✓ reCAPTCHA detected after all, solving...")
+                if self._solve_and_wait_for_email(page):
+                    email = self._find_email_on_page(page)
+            
             if email:
-                print(f"  ✓ Email extracted: {email}")
+                logger.info(f"  ✓ Email extracted: {email}")
             else:
-                print("  ✗ Could not find email on page after clicking button")
+                logger.warning("  ✗ Could not find email on page after clicking button")
+            if not email and config.DEBUG:
                 # Debug: Check what's on the page
                 try:
                     page_text = page.inner_text('body')
@@ -608,63 +677,44 @@ class YouTubeScraper:
                         # Find context around @ symbols
                         lines_with_at = [line for line in page_text.split('\n') if '@' in line]
                         if lines_with_at:
-                            print(f"  Debug: Found {len(lines_with_at)} lines with '@' symbol")
+                            logger.debug("  Debug: Found %d lines with '@' symbol", len(lines_with_at))
                             for line in lines_with_at[:3]:  # Show first 3
-                                print(f"    - {line.strip()[:100]}")
+                                logger.debug("    - %s", line.strip()[:100])
                 except Exception as e:
-                    print(f"  Debug: Error checking page content: {e}")
+                    logger.debug("  Debug: Error checking page content: %s", e)
             
             return email
             
         except Exception as e:
-            print(f"  ✗ Error extracting email: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"  ✗ Error extracting email: {e}", exc_info=config.DEBUG)
             return None
     
     def _has_recaptcha(self, page: Page) -> bool:
         """Check if reCAPTCHA is present on the page."""
         try:
-            # Method 1: Look for reCAPTCHA iframe by title
-            try:
-                recaptcha_frame = page.frame_locator('iframe[title*="reCAPTCHA"]').first
-                if recaptcha_frame.locator('body').count(timeout=2000) > 0:
-                    print("    Found reCAPTCHA via iframe title")
-                    return True
-            except:
-                pass
+            # Method 1: One query for a reCAPTCHA iframe (by src or title) or container div
+            if page.locator(_RECAPTCHA_ELEMENT_SELECTOR).count() > 0:
+                logger.info("    Found reCAPTCHA element")
+                return True
             
-            # Method 2: Look for reCAPTCHA by src
-            try:
-                captcha_iframes = page.locator('iframe[src*="recaptcha"]').all()
-                if len(captcha_iframes) > 0:
-                    print("    Found reCAPTCHA via iframe src")
-                    return True
-            except:
-                pass
-            
-            # Method 3: Look for reCAPTCHA container div
-            try:
-                recaptcha_div = page.locator('.g-recaptcha, [class*="recaptcha"]').first
-                if recaptcha_div.count(timeout=2000) > 0:
-                    print("    Found reCAPTCHA via div class")
-                    return True
-            except:
-                pass
-            
-            # Method 4: Check page content for recaptcha strings
-            try:
-                content = page.content()
-                if 'recaptcha' in content.lower() or 'g-recaptcha' in content:
-                    print("    Found reCAPTCHA in page content")
-                    return True
-            except:
-                pass
+            # Method 2: Check page content for recaptcha strings (e.g. scripts not yet rendered)
+            if self._search_html(page, _RECAPTCHA_RE):
+                logger.info("    Found reCAPTCHA in page content")
+                return True
             
             return False
         except Exception as e:
-            print(f"    Error checking for reCAPTCHA: {e}")
+            logger.warning(f"    Error checking for reCAPTCHA: {e}")
+            return False
+    
+    def _solve_and_wait_for_email(self, page: Page) -> bool:
+        """Solve the reCAPTCHA and wait for the revealed email; returns False if solving failed."""
+        if not self._solve_recaptcha(page):
+            logger.warning("  ✗ Failed to solve reCAPTCHA")
             return False
+        logger.info("  ✓ reCAPTCHA solved and submitted, waiting for email to appear...")
+        self._wait_for_email(page, 13000)
+        return True
     
     def _solve_recaptcha(self, page: Page) -> bool:
         """
@@ -674,257 +724,99 @@ class YouTubeScraper:
             True if successful
         """
         try:
-            print("    Looking for reCAPTCHA sitekey...")
-            
-            # Find the reCAPTCHA sitekey - try multiple methods
-            sitekey = None
-            
-            # Method 1: Look in page HTML
-            page_content = page.content()
-            sitekey_match = re.search(r'data-sitekey="([^"]+)"', page_content)
-            if sitekey_match:
-                sitekey = sitekey_match.group(1)
-                print(f"    Found sitekey in HTML: {sitekey[:20]}...")
-            
-            # Method 2: Try to get from g-recaptcha div
-            if not sitekey:
-                try:
-                    recaptcha_div = page.locator('.g-recaptcha').first
-                    if recaptcha_div.count() > 0:
-                        sitekey = recaptcha_div.get_attribute('data-sitekey')
-                        if sitekey:
-                            print(f"    Found sitekey in div: {sitekey[:20]}...")
-                except:
-                    pass
+            logger.info("    Looking for reCAPTCHA sitekey...")
             
-            # Method 3: Common YouTube reCAPTCHA sitekey (fallback)
-            if not sitekey:
-                # Look for any sitekey pattern in the page
-                sitekey_patterns = [
-                    r'sitekey["\s:]+([A-Za-z0-9_-]{40,})',
-                    r'"sitekey"\s*:\s*"([^"]+)"',
-                ]
-                for pattern in sitekey_patterns:
-                    match = re.search(pattern, page_content)
-                    if match:
-                        sitekey = match.group(1)
-                        print(f"    Found sitekey via pattern: {sitekey[:20]}...")
-                        break
+            # Find the reCAPTCHA sitekey in the page HTML: a data-sitekey attribute
+            # (which also covers the .g-recaptcha div) or a sitekey in inline config
+            sitekey = self._search_html(page, _SITEKEY_RE)
+            if sitekey:
+                logger.info(f"    Found sitekey in HTML: {sitekey[:20]}...")
             
             if not sitekey:
-                print("    ✗ Could not find reCAPTCHA sitekey")
+                logger.warning("    ✗ Could not find reCAPTCHA sitekey")
                 return False
             
             # Solve captcha using 2Captcha
-            print(f"    Submitting to 2Captcha...")
+            logger.info(f"    Submitting to 2Captcha...")
             solution = self.captcha_solver.solve_recaptcha(sitekey, page.url)
             
             if not solution:
-                print("    ✗ 2Captcha failed to solve")
+                logger.warning("    ✗ 2Captcha failed to solve")
                 return False
             
             # Inject the solution
-            print("    Injecting solution into page...")
-            
-            # Method 1: Inject into all possible reCAPTCHA response fields
-            try:
-                inject_script = f"""
-                // Find and fill all g-recaptcha-response elements
-                var textareas = document.querySelectorAll('[name="g-recaptcha-response"], #g-recaptcha-response, .g-recaptcha-response');
-                for (var i = 0; i < textareas.length; i++) {{
-                    textareas[i].innerHTML = '{solution}';
-                    textareas[i].value = '{solution}';
-                    textareas[i].style.display = 'block';
-                }}
-                console.log('Injected solution into ' + textareas.length + ' fields');
-                """
-                page.evaluate(inject_script)
-                print("    ✓ Injected solution into response fields")
-            except Exception as e:
-                print(f"    Warning: Injection error: {e}")
-            
-            page.wait_for_timeout(1000)
+            logger.info("    Injecting solution into page...")
             
-            # Method 2: Trigger reCAPTCHA callback to mark as solved
+            # Inject into all reCAPTCHA response fields and trigger the callback in one call
             try:
-                callback_script = f"""
-                (function() {{
-                    // Method 1: Try standard callback
-                    if (typeof ___grecaptcha_cfg !== 'undefined') {{
-                        var clients = ___grecaptcha_cfg.clients;
-                        for (var id in clients) {{
-                            if (clients[id] && clients[id].callback) {{
-                                clients[id].callback('{solution}');
-                                return true;
-                            }}
-                        }}
-                    }}
-                    
-                    // Method 2: Try to find and execute callback from data attribute
-                    var recaptchaElement = document.querySelector('.g-recaptcha');
-                    if (recaptchaElement) {{
-                        var callback = recaptchaElement.getAttribute('data-callback');
-                        if (callback && typeof window[callback] === 'function') {{
-                            window[callback]('{solution}');
-                            return true;
-                        }}
-                    }}
-                    
-                    return false;
-                }})();
-                """
-                result = page.evaluate(callback_script)
-                if result:
-                    print("    ✓ Triggered reCAPTCHA callback")
+                result = page.evaluate(_SUBMIT_SOLUTION_JS, solution)
+                logger.info(f"    ✓ Injected solution into {result['injected']} response field(s)")
+                if result['calledBack']:
+                    logger.info("    ✓ Triggered reCAPTCHA callback")
+                    # The callback usually reveals the email; give it a moment before looking for Submit
+                    self._wait_for_email(page, 2000)
                 else:
-                    print("    Note: No callback found (will try submit button)")
+                    logger.info("    Note: No callback found (will try submit button)")
             except Exception as e:
-                print(f"    Note: Callback trigger: {e}")
+                logger.warning(f"    Warning: Injection error: {e}")
             
-            page.wait_for_timeout(2000)
-            
-            # Method 3: Find and click the Submit button
-            print("    Looking for Submit button...")
+            # Find and click the Submit button
+            logger.info("    Looking for Submit button...")
+            # One query for the first visible element that is a submit control or says "Submit"
+            submit_button = page.query_selector(_SUBMIT_BUTTON_SELECTOR)
             submit_clicked = False
-            submit_selectors = [
-                "button:has-text('Submit')",
-                "input[type='submit']",
-                "button[type='submit']",
-                "[aria-label*='submit' i]",
-                "button:has-text('submit')",
-                "yt-button-renderer button",
-            ]
-            
-            for selector in submit_selectors:
+            if submit_button:
                 try:
-                    buttons = page.locator(selector).all()
-                    for button in buttons:
-                        try:
-                            if button.is_visible(timeout=1000):
-                                button_text = button.inner_text(timeout=1000).lower() if button.inner_text(timeout=500) else ""
-                                # Make sure it's actually a submit button
-                                if 'submit' in button_text.lower() or selector == "button[type='submit']" or selector == "input[type='submit']":
-                                    print(f"    ✓ Found Submit button, clicking...")
-                                    button.click(timeout=3000)
-                                    submit_clicked = True
-                                    print("    ✓ Submit button clicked!")
-                                    break
-                        except Exception as e:
-                            continue
-                    if submit_clicked:
-                        break
-                except:
-                    continue
+                    logger.info(f"    ✓ Found Submit button, clicking...")
+                    submit_button.click(timeout=3000)
+                    submit_clicked = True
+                    logger.info("    ✓ Submit button clicked!")
+                except Exception:
+                    pass
             
             if not submit_clicked:
-                print("    ⚠ Submit button not found - form may auto-submit")
+                logger.info("    ⚠ Submit button not found - form may auto-submit")
             
-            print("    ✓ reCAPTCHA solution processed")
+            logger.info("    ✓ reCAPTCHA solution processed")
             return True
             
         except Exception as e:
-            print(f"    ✗ Error solving reCAPTCHA: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning(f"    ✗ Error solving reCAPTCHA: {e}", exc_info=config.DEBUG)
             return False
     
     def _find_email_on_page(self, page: Page) -> Optional[str]:
         """Find email address on the page after captcha is solved or button clicked."""
         try:
-            # Wait a bit for email to appear
-            page.wait_for_timeout(2000)
-            
-            # Common email regex pattern - more permissive
-            email_pattern = r'\b[A-Za-z0-9][A-Za-z0-9._%+-]*@[A-Za-z0-9][A-Za-z0-9.-]*\.[A-Za-z]{2,}\b'
-            
-            # Method 1: Try to find email in visible text (most reliable after form submit)
+            # Match inside the page so the body text and HTML never cross the Playwright channel
             try:
-                visible_text = page.inner_text('body')
-                matches = re.findall(email_pattern, visible_text, re.IGNORECASE)
-                
-                if matches:
-                    # Filter out common false positives
-                    exclude = ['noreply@', 'example@', 'test@', '@youtube', '@google', 'support@', 'privacy@', 'copyright@']
-                    valid_emails = []
-                    for email in matches:
-                        email_lower = email.lower()
-                        # Skip if it's a false positive
-                        if any(ex in email_lower for ex in exclude):
-                            continue
-                        # Skip if it's just a handle (no dot in domain)
-                        if '@' in email and '.' in email.split('@')[1]:
-                            valid_emails.append(email)
-                    
-                    if valid_emails:
-                        print(f"    Found {len(valid_emails)} potential email(s) in visible text")
-                        return valid_emails[0]
-            except Exception as e:
-                print(f"  Debug: Error in visible text search: {e}")
-            
-            # Method 2: Look for email in specific modal/dialog elements that appear after submit
-            try:
-                modal_selectors = [
-                    '[role="dialog"]',
-                    '.ytd-about-channel-renderer',
-                    'ytd-about-channel-renderer',
-                    '#content-container',
-                    'yt-formatted-string',
-                ]
-                
-                for selector in modal_selectors:
-                    try:
-                        elements = page.locator(selector).all()
-                        for element in elements:
-                            try:
-                                if element.is_visible(timeout=1000):
-                                    elem_text = element.inner_text(timeout=2000)
-                                    matches = re.findall(email_pattern, elem_text, re.IGNORECASE)
-                                    if matches:
-                                        exclude = ['noreply@', 'example@', 'test@', '@youtube', '@google', 'support@']
-                                        for email in matches:
-                                            if not any(ex in email.lower() for ex in exclude):
-                                                if '@' in email and '.' in email.split('@')[1]:
-                                                    print(f"    Found email in element: {selector}")
-                                                    return email
-                            except:
-                                continue
-                    except:
-                        continue
+                found = page.evaluate(_FIND_EMAIL_JS, [
+                    _REVEALED_EMAIL_SELECTOR, _EMAIL_MODAL_SELECTORS,
+                    _PAGE_EMAIL_RE.pattern, _PAGE_EMAIL_EXCLUDE_RE.pattern
+                ])
+                if found:
+                    where, email = found
+                    logger.info(f"    Found email in {where}")
+                    return email
+                return None
             except Exception as e:
-                print(f"  Debug: Error in modal search: {e}")
+                logger.debug("  Debug: Error in in-page email search: %s", e)
             
-            # Method 3: Search in page HTML content
-            try:
-                content = page.content()
-                matches = re.findall(email_pattern, content, re.IGNORECASE)
-                
-                if matches:
-                    # Filter out common false positives
-                    exclude = ['noreply@', 'example@', 'test@', '@youtube', '@google', 'support@', 'privacy@', 'copyright@']
-                    valid_emails = []
-                    for email in matches:
-                        email_lower = email.lower()
-                        if any(ex in email_lower for ex in exclude):
-                            continue
-                        if '@' in email and '.' in email.split('@')[1]:
-                            valid_emails.append(email)
-                    
-                    if valid_emails:
-                        print(f"    Found {len(valid_emails)} potential email(s) in HTML")
-                        return valid_emails[0]
-            except Exception as e:
-                print(f"  Debug: Error in HTML content search: {e}")
+            # Fallback: search the serialized HTML in Python
+            email = _first_valid_email(page.content())
+            if email:
+                logger.info("    Found email in HTML")
+                return email
             
             return None
             
         except Exception as e:
-            print(f"  Error finding email: {e}")
+            logger.warning(f"  Error finding email: {e}")
             return None
 
 
 def test_scraper():
     """Test the scraper on a sample channel."""
-    print("Testing YouTube scraper...\n")
+    logger.info("Testing YouTube scraper...\n")
     
     scraper = YouTubeScraper()
     
@@ -936,21 +828,22 @@ def test_scraper():
         data = scraper.scrape_channel(test_url)
         
         if data:
-            print("\n" + "="*60)
-            print("SCRAPED DATA:")
-            print("="*60)
+            logger.info("\n" + "="*60)
+            logger.info("SCRAPED DATA:")
+            logger.info("="*60)
             for key, value in data.items():
                 if key != "social_links":
-                    print(f"{key}: {value}")
+                    logger.info(f"{key}: {value}")
             if "social_links" in data:
-                print("social_links:")
+                logger.info("social_links:")
                 for name, url in data["social_links"].items():
-                    print(f"  - {name}: {url}")
+                    logger.info(f"  - {name}: {url}")
         
     finally:
         scraper.close()
 
 
 if __name__ == "__main__":
+    config.setup_logging(verbose=True)
     test_scraper()
 
@@ -1,10 +1,47 @@
 """YouTube session management for maintaining login state."""
 import json
+import logging
 import os
+import threading
 from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import config
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Parsed storage state per session file, reused by every worker while the file is unchanged
+_storage_cache: Dict[str, Tuple[float, dict]] = {}
+_storage_lock = threading.Lock()
+
+
+def _load_storage_state(path: str) -> dict:
+    """
+    Load a Playwright storage state file, parsing it again only when it has changed on disk.
+    
+    Args:
+        path: Storage state JSON file
+        
+    Returns:
+        Parsed storage state
+    """
+    path = os.path.abspath(path)
+    mtime = os.path.getmtime(path)
+    with _storage_lock:
+        cached = _storage_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with open(path, 'rb') as f:
+            raw = f.read()
+        state = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        _storage_cache[path] = (mtime, state)
+        return state
+
 
 class SessionManager:
     """Manages YouTube authentication and session persistence."""
@@ -71,10 +108,8 @@ class SessionManager:
                 # Wait for user to press Enter
                 input("Press ENTER after you've logged in...")
                 
-                # Save the session
-                storage_state = context.storage_state()
-                with open(self.session_file, 'w') as f:
-                    json.dump(storage_state, f, indent=2)
+                # Save the session (Playwright writes the file itself)
+                context.storage_state(path=self.session_file)
                 
                 print("Closing browser...")
                 page.close()
@@ -100,6 +135,7 @@ class SessionManager:
         
         Args:
             headless: Whether to run in headless mode. If None, uses config setting.
+                Ignored when config.CDP_URL points at a shared browser.
             use_session: Whether to load saved session. If False, starts fresh browser.
             
         Returns:
@@ -109,26 +145,40 @@ class SessionManager:
             headless = config.HEADLESS
         
         if use_session and not self.session_exists():
-            print(f"Warning: No session file found at {self.session_file}")
-            print("Starting browser without saved session. You may need to log in manually.")
+            logger.warning(f"Warning: No session file found at {self.session_file}")
+            logger.warning("Starting browser without saved session. You may need to log in manually.")
             use_session = False
         
         self.playwright = sync_playwright().start()
         
-        # Try Firefox first (more stable on macOS), fallback to Chromium
-        try:
-            self.browser = self.playwright.firefox.launch(headless=headless)
-        except Exception as e:
-            print(f"Firefox failed: {e}, using Chromium...")
-            self.browser = self.playwright.chromium.launch(
-                headless=headless,
-                args=['--disable-blink-features=AutomationControlled']
-            )
+        if config.CDP_URL:
+            # Attach to an already running Chromium shared with other workers; each gets its own context
+            self.browser = self.playwright.chromium.connect_over_cdp(config.CDP_URL)
+            logger.info(f"✓ Connected to shared browser at {config.CDP_URL}")
+        else:
+            # Try Firefox first (more stable on macOS), fallback to Chromium.
+            # Images are disabled in the engine too, so they never reach the context's route handler.
+            try:
+                self.browser = self.playwright.firefox.launch(
+                    headless=headless,
+                    firefox_user_prefs={'permissions.default.image': 2}
+                )
+            except Exception as e:
+                logger.warning(f"Firefox failed: {e}, using Chromium...")
+                self.browser = self.playwright.chromium.launch(
+                    headless=headless,
+                    args=[
+                        '--disable-blink-features=AutomationControlled',
+                        # Containers often have a tiny /dev/shm, which crashes tabs under load.
+                        # Chromium only: Firefox has no such switch (see README, Troubleshooting)
+                        '--disable-dev-shm-usage',
+                        '--blink-settings=imagesEnabled=false',
+                    ]
+                )
         
         # Load the saved session if requested
         if use_session:
-            with open(self.session_file, 'r') as f:
-                storage_state = json.load(f)
+            storage_state = _load_storage_state(self.session_file)
             
             self.context = self.browser.new_context(
                 storage_state=storage_state,
@@ -152,7 +202,7 @@ class SessionManager:
             True if session is valid
         """
         if not self.context:
-            print("No active browser context. Call start_browser() first.")
+            logger.warning("No active browser context. Call start_browser() first.")
             return False
         
         page = self.context.new_page()
@@ -161,20 +211,18 @@ class SessionManager:
             page.wait_for_timeout(2000)
             
             # Check if user avatar/profile button is present (indicates logged in)
-            # This button has id="avatar-btn" when logged in
-            avatar_button = page.locator('#avatar-btn').first
-            
-            if avatar_button.count() > 0:
-                print("✓ Session is valid - user is logged in")
+            # This button has id="avatar-btn" when logged in; one query, None when absent
+            if page.query_selector('#avatar-btn') is not None:
+                logger.info("✓ Session is valid - user is logged in")
                 page.close()
                 return True
             else:
-                print("✗ Session expired - user is not logged in")
+                logger.warning("✗ Session expired - user is not logged in")
                 page.close()
                 return False
                 
         except Exception as e:
-            print(f"Error verifying session: {e}")
+            logger.error(f"Error verifying session: {e}")
             page.close()
             return False
     
@@ -185,6 +233,7 @@ class SessionManager:
             self.context = None
         
         if self.browser:
+            # For a browser attached over CDP this only disconnects; the shared process keeps running
             self.browser.close()
             self.browser = None
         
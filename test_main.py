@@ -0,0 +1,64 @@
+"""Tests for channel URL normalization in main.py."""
+import os
+import tempfile
+import unittest
+
+from main import canonical_channel_url, iter_urls
+
+
+class CanonicalChannelUrlTest(unittest.TestCase):
+    """canonical_channel_url maps every spelling of a channel to one URL."""
+    
+    def test_strips_host_variants_and_tabs(self):
+        self.assertEqual(
+            canonical_channel_url("https://m.youtube.com/@NetworkChuck/videos?view=0"),
+            "https://www.youtube.com/@NetworkChuck"
+        )
+    
+    def test_keeps_percent_encoded_handle_whole(self):
+        self.assertEqual(
+            canonical_channel_url("https://www.youtube.com/@caf%C3%A9/about"),
+            "https://www.youtube.com/@caf%C3%A9"
+        )
+    
+    def test_encoded_and_literal_handle_match(self):
+        self.assertEqual(
+            canonical_channel_url("https://www.youtube.com/@café"),
+            canonical_channel_url("https://www.youtube.com/@caf%C3%A9")
+        )
+    
+    def test_non_channel_url_unchanged(self):
+        url = "https://www.youtube.com/watch?v=abc"
+        self.assertEqual(canonical_channel_url(url), url)
+
+
+class IterUrlsTest(unittest.TestCase):
+    """iter_urls de-duplicates channels without merging distinct ones."""
+    
+    def test_handles_sharing_a_prefix_stay_distinct(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as f:
+            f.write("https://www.youtube.com/@caf%C3%A9\n")
+            f.write("https://www.youtube.com/@caf\n")
+            f.write("@café\n")
+        try:
+            self.assertEqual(list(iter_urls(f.name)), [
+                "https://www.youtube.com/@caf%C3%A9",
+                "https://www.youtube.com/@caf",
+            ])
+        finally:
+            os.remove(f.name)
+    
+    def test_reads_non_ascii_handles_as_utf8(self):
+        with tempfile.NamedTemporaryFile('wb', suffix='.txt', delete=False) as f:
+            f.write("@日本語チャンネル\nhttps://www.youtube.com/@café/videos\n".encode('utf-8'))
+        try:
+            self.assertEqual(list(iter_urls(f.name)), [
+                "https://www.youtube.com/@%E6%97%A5%E6%9C%AC%E8%AA%9E%E3%83%81%E3%83%A3%E3%83%B3%E3%83%8D%E3%83%AB",
+                "https://www.youtube.com/@caf%C3%A9",
+            ])
+        finally:
+            os.remove(f.name)
+
+
+if __name__ == "__main__":
+    unittest.main()